@@ -0,0 +1,111 @@
+"""
+Compares the throughput of parsing manga pages inline in the serving
+threads against offloading it to the parse process pool.
+
+Each simulated request waits `--io-ms` for the upstream, like a real fetch,
+and then parses a synthetic manga page with `--chapters` chapters.
+
+Usage:
+    python benchmarks/parsing.py [--threads N] [--requests N] [--chapters N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+import manganatoapi  # noqa: E402, F401
+from manganatoapi import settings  # noqa: E402
+from manganatoapi.services.manga import MangaService  # noqa: E402
+from manganatoapi.services.parser import ParserService  # noqa: E402
+from manganatoapi.services.request import Page  # noqa: E402
+
+
+def manga_page(chapters: int) -> str:
+    """
+    Builds a manga page shaped like the upstream one.
+    """
+    rows = ''.join(
+        f'<li class="a-h"><a class="chapter-name" '
+        f'href="https://chapmanganato.to/manga-aa951409/chapter-{i}">'
+        f'Chapter {i}: The chapter title</a>'
+        f'<span class="chapter-view">12,345</span>'
+        f'<span class="chapter-time">Jan 01,24</span></li>'
+        for i in range(chapters, 0, -1)
+    )
+    return (
+        '<html><head><title>Manga</title></head><body>'
+        '<div class="story-info-left"><span class="info-image">'
+        '<img src="https://example.com/cover.jpg"></span></div>'
+        '<div class="story-info-right"><h1>Manga</h1><table>'
+        '<tr><td>Author(s) :</td><td><a>Author</a></td></tr>'
+        '<tr><td>Status :</td><td>Ongoing</td></tr>'
+        '<tr><td>Genres :</td><td><a>Action</a> - <a>Drama</a></td></tr>'
+        '</table><div class="story-info-right-extent">'
+        '<p><span>Updated :</span><span>Jan 01,2024</span></p>'
+        '<p><span>View :</span><span>1M</span></p></div></div>'
+        '<div class="panel-story-info-description">Description : '
+        + 'A long description sentence. '
+        * 50
+        + '</div><div class="panel-story-chapter-list">'
+        f'<ul class="row-content-chapter">{rows}</ul></div></body></html>'
+    )
+
+
+def run(page: Page, threads: int, requests: int, io: float) -> float:
+    """
+    Serves `requests` simulated requests on `threads` threads.
+
+    Returns:
+        float: The throughput in requests per second.
+    """
+
+    def request(_):
+        time.sleep(io)
+        return ParserService.parse(
+            'MangaService.info', MangaService._parse_info, page
+        )
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(request, range(requests)))
+
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--chapters', type=int, default=1000)
+    parser.add_argument('--io-ms', type=float, default=20.0)
+    args = parser.parse_args()
+
+    page = Page('', manga_page(args.chapters).encode('utf-8'), 'utf-8')
+    io = args.io_ms / 1000
+
+    print(
+        f'{len(page.content) / 1024:.0f} KB page, {args.threads} threads, '
+        f'{args.requests} requests, {args.io_ms:.0f} ms upstream'
+    )
+
+    settings.PARSE_OFFLOAD = set()
+    inline = run(page, args.threads, args.requests, io)
+    print(f'inline:    {inline:8.1f} req/s')
+
+    settings.PARSE_OFFLOAD = {'MangaService.info'}
+    run(page, args.threads, args.threads, io)  # warm up the pool
+    offload = run(page, args.threads, args.requests, io)
+    print(f'offloaded: {offload:8.1f} req/s ({offload / inline:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+"""
+Measures the cold start cost of a worker: the import profile of the WSGI
+application, the time until a freshly started gunicorn answers its first
+request, and the time of its first request that fetches and parses a page.
+
+Heavy dependencies (parsel/lxml, requests, sqlite3) are imported on first
+use, so the first parsed request pays for them in every worker, even with
+`--preload`. That request is served from a local fixture page, so no
+upstream is reached.
+
+Usage:
+    python benchmarks/startup.py [--runs N] [--chapters N] [--target MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(module: str = 'manganatoapi.wsgi', top: int = 10):
+    """
+    Imports `module` in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        tuple[float, list[tuple[float, str]]]: The total import time of the
+            module in milliseconds and the `top` slowest imports by
+            cumulative time.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = []
+
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        imports.append((int(cumulative) / 1000, name.rstrip()))
+
+    total = next(ms for ms, name in imports if name.strip() == module)
+    imports.sort(reverse=True)
+
+    return total, imports[:top]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def fixture_application():
+    """
+    Gunicorn application factory serving the API with manga pages fetched
+    from the fixture server at ``STARTUP_FIXTURE_URL`` instead of upstream.
+    """
+    from manganatoapi.services import manga
+    from manganatoapi.wsgi import application
+
+    manga.MANGA_INFO_URL_PREFIX['mu'] = os.environ['STARTUP_FIXTURE_URL']
+
+    return application
+
+
+def serve_fixture(page: bytes) -> ThreadingHTTPServer:
+    """
+    Serves `page` on every path from a background thread.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('content-type', 'text/html; charset=utf-8')
+            self.send_header('content-length', str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def _get(url: str, timeout: float) -> None:
+    try:
+        urllib.request.urlopen(url, timeout=timeout).read()
+    except urllib.error.HTTPError:
+        pass
+
+
+def time_to_first_request(
+    fixture_url: str, timeout: float = 30.0
+) -> tuple[float, float]:
+    """
+    Starts gunicorn the way the Procfile does, polls an unrouted path until
+    the first HTTP response, whatever its status, and then requests a manga
+    served from the fixture.
+
+    Returns:
+        tuple[float, float]: The time until the first response and the
+            duration of the first parsed request, in milliseconds.
+    """
+    port = _free_port()
+    base_url = f'http://127.0.0.1:{port}'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            'DEBUG': 'false',
+            'STARTUP_FIXTURE_URL': fixture_url,
+            'URL_DB': os.path.join(tmp, 'urls.db'),
+        }
+
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                '-m',
+                'gunicorn',
+                '--preload',
+                '--threads',
+                '8',
+                '--bind',
+                f'127.0.0.1:{port}',
+                '--pythonpath',
+                os.path.join(ROOT, 'benchmarks'),
+                'startup:fixture_application()',
+            ],
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        try:
+            while True:
+                if time.perf_counter() - start > timeout:
+                    raise TimeoutError(
+                        f'{base_url} did not answer in {timeout}s'
+                    )
+                try:
+                    _get(f'{base_url}/v1/__startup__', timeout)
+                except OSError:
+                    time.sleep(0.005)
+                    continue
+                break
+
+            ready = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            _get(f'{base_url}/v1/mangas/mu-manga-startup', timeout)
+            first = (time.perf_counter() - start) * 1000
+
+            return ready, first
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+def _summary(samples: list[float]) -> str:
+    return (
+        f'median {statistics.median(samples):.1f} ms, '
+        f'min {min(samples):.1f} ms, max {max(samples):.1f} ms'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument(
+        '--chapters',
+        type=int,
+        default=1000,
+        help='chapters of the fixture manga page',
+    )
+    parser.add_argument(
+        '--target',
+        type=float,
+        default=None,
+        help='fail if the median time to the first parsed response exceeds '
+        'it (ms)',
+    )
+    args = parser.parse_args()
+
+    from parsing import manga_page
+
+    total, slowest = import_profile()
+
+    print(f'import manganatoapi.wsgi: {total:.1f} ms')
+    for ms, name in slowest:
+        print(f'  {ms:8.1f} ms {name}')
+
+    server = serve_fixture(manga_page(args.chapters).encode('utf-8'))
+    fixture_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    try:
+        samples = [
+            time_to_first_request(fixture_url) for _ in range(args.runs)
+        ]
+    finally:
+        server.shutdown()
+
+    ready = [r for r, _ in samples]
+    first = [f for _, f in samples]
+    total = [r + f for r, f in samples]
+
+    print(f'time to first response: {_summary(ready)}')
+    print(f'first parsed request:   {_summary(first)}')
+    print(f'time to first parsed response: {_summary(total)}')
+
+    median = statistics.median(total)
+
+    if args.target is not None and median > args.target:
+        print(f'over target of {args.target:.1f} ms')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
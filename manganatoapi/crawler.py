@@ -0,0 +1,242 @@
+"""
+Background crawler that ingests the manganato listing into the local catalog.
+
+Usage:
+    python -m manganatoapi.crawler [--full] [--max-pages N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from restcraft.wsgi import get_wsgi_application
+
+from . import settings
+from .exceptions import NotFound
+from .services.catalog import CATALOG_PAGE_SIZE, CatalogService
+from .services.manga import MangaService
+
+logger = logging.getLogger(__name__)
+
+RANK_RUN_SIZE = 10**7
+
+INFO_ATTEMPTS = 3
+
+
+class RateLimiter:
+    """
+    Spaces out upstream requests so that at most one request is started per
+    `interval` seconds, regardless of how many workers are running.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Crawler:
+    """
+    Walks the `MANGA_UPDATES_URL` listing page by page and follows every new
+    or updated manga into `MangaService.info`, storing the results in the
+    `CatalogService`.
+
+    The next page to crawl is checkpointed after every page, so an
+    interrupted run resumes where it stopped. Unless `full` is set, the crawl
+    stops at the first page where every manga was already stored with the
+    same last chapter.
+    """
+
+    def __init__(
+        self,
+        manga: type[MangaService] | MangaService,
+        catalog: CatalogService,
+        workers: int = 4,
+        delay: float = 1.0,
+    ):
+        self.manga = manga
+        self.catalog = catalog
+        self.workers = workers
+        self.limiter = RateLimiter(delay)
+
+    def _fetch_info(self, manga_id: str):
+        """
+        Fetches the details of a manga, retrying upstream errors up to
+        `INFO_ATTEMPTS` times.
+
+        Returns:
+            dict | None: The details, or `None` if the manga was not found or
+                could not be fetched, in which case it is fetched again on
+                the next run.
+        """
+        prefix, _, manga = manga_id.partition('-')
+
+        for attempt in range(1, INFO_ATTEMPTS + 1):
+            self.limiter.wait()
+
+            try:
+                return self.manga.info(manga=manga, prefix=prefix)
+            except NotFound:
+                logger.warning('Manga %s not found, skipping', manga_id)
+                return None
+            except requests.RequestException as e:
+                logger.warning(
+                    'Failed to fetch manga %s (attempt %s of %s): %s',
+                    manga_id,
+                    attempt,
+                    INFO_ATTEMPTS,
+                    e,
+                )
+
+        return None
+
+    def _crawl_page(self, pool: ThreadPoolExecutor, run: int, page: int):
+        """
+        Crawls a single listing page.
+
+        Returns:
+            tuple[int, int]: The number of entries on the page and how many
+                of them were new or updated.
+        """
+        self.limiter.wait()
+
+        listing = self.manga.updates(page)
+        pending = []
+        changed = 0
+
+        for position, item in enumerate(listing):
+            manga_id = item['url'].rsplit('/', 1)[-1]
+            rank = (
+                run * RANK_RUN_SIZE - (page - 1) * CATALOG_PAGE_SIZE - position
+            )
+
+            has_info, last_chapter = self.catalog.last_chapter(manga_id)
+
+            if has_info and last_chapter == item['last_chapter']:
+                self.catalog.save(manga_id, rank, item)
+                continue
+
+            changed += 1
+            pending.append(
+                (manga_id, rank, item, pool.submit(self._fetch_info, manga_id))
+            )
+
+        for manga_id, rank, item, future in pending:
+            self.catalog.save(manga_id, rank, item, future.result())
+
+        return len(listing), changed
+
+    def run(self, full: bool = False, max_pages: int | None = None) -> int:
+        """
+        Runs a crawl, resuming from the last checkpoint if a previous run was
+        interrupted.
+
+        Args:
+            full (bool): Crawl every page instead of stopping at the first
+                page that has no changes.
+            max_pages (int, optional): Stop after this page number.
+
+        Returns:
+            int: The number of pages crawled.
+        """
+        checkpoint = self.catalog.get_state('page')
+
+        if checkpoint:
+            run = int(self.catalog.get_state('run', '1'))
+            page = int(checkpoint)
+            full = self.catalog.get_state('full') == '1' or full
+            logger.info('Resuming run %s from page %s', run, page)
+        else:
+            run = int(self.catalog.get_state('run', '0')) + 1
+            page = 1
+            self.catalog.set_state('run', str(run))
+            self.catalog.set_state('full', '1' if full else '0')
+
+        crawled = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while max_pages is None or page <= max_pages:
+                self.catalog.set_state('page', str(page))
+
+                try:
+                    total, changed = self._crawl_page(pool, run, page)
+                except NotFound:
+                    break
+
+                crawled += 1
+                logger.info(
+                    'Page %s: %s entries, %s new or updated',
+                    page,
+                    total,
+                    changed,
+                )
+
+                if total == 0 or (not full and changed == 0):
+                    break
+
+                page += 1
+
+        self.catalog.set_state('page', None)
+
+        return crawled
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Ingest the manganato listing into the local catalog.'
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='crawl every page instead of stopping at the first unchanged one',
+    )
+    parser.add_argument(
+        '--max-pages', type=int, default=None, help='last page to crawl'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=settings.CRAWLER_WORKERS,
+        help='concurrent manga info requests',
+    )
+    parser.add_argument(
+        '--delay',
+        type=float,
+        default=settings.CRAWLER_DELAY,
+        help='minimum seconds between upstream requests',
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+    get_wsgi_application()
+
+    catalog = CatalogService()
+
+    if not catalog.enabled:
+        parser.error('CATALOG_DB is not set.')
+
+    crawler = Crawler(
+        MangaService, catalog, workers=args.workers, delay=args.delay
+    )
+    pages = crawler.run(full=args.full, max_pages=args.max_pages)
+
+    logger.info('Crawl finished, %s pages', pages)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,10 @@
 class NotFound(Exception):
     """The requested resource was not found."""
+
+
+class InvalidPageRange(Exception):
+    """The requested page range is not valid."""
+
+
+class InvalidFields(Exception):
+    """The requested fields are not valid."""
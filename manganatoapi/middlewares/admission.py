@@ -0,0 +1,245 @@
+"""
+Admission control for the WSGI application.
+
+This is a WSGI middleware rather than a RestCraft `Middleware`: a slot must
+be held until the response body has been fully sent, which includes
+streamed images, and released even when a view raises.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import typing as t
+from collections import deque
+
+from restcraft.core import Request
+from restcraft.core.di import inject
+
+from .. import exceptions, settings, utils
+from ..services.manga import LISTING_FIELDS
+
+if t.TYPE_CHECKING:
+    from ..services.catalog import CatalogService
+    from ..services.listing import ListingService
+
+logger = logging.getLogger(__name__)
+
+
+class _Waiter:
+    """
+    A cache miss waiting in the queue of an `AdmissionLimiter`.
+    """
+
+    __slots__ = ('evicted',)
+
+    def __init__(self):
+        self.evicted = False
+
+
+class AdmissionLimiter:
+    """
+    A concurrency limit with a bounded wait queue, where waiting cache hits
+    are admitted before waiting cache misses. A cache hit that finds the
+    queue full takes the place of the last waiting cache miss, which is
+    rejected instead.
+    """
+
+    def __init__(self, concurrency: int, queue: int, timeout: float):
+        self.concurrency = concurrency
+        self.queue = queue
+        self.timeout = timeout
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting_hits = 0
+        self._waiting_misses: deque[_Waiter] = deque()
+
+    def _can_enter(self, hit: bool) -> bool:
+        return self._active < self.concurrency and (
+            hit or self._waiting_hits == 0
+        )
+
+    def acquire(self, hit: bool) -> bool:
+        """
+        Takes a slot, waiting up to `timeout` seconds in the queue.
+
+        Args:
+            hit (bool): Whether the request is expected to be a cache hit.
+
+        Returns:
+            bool: Whether the request was admitted.
+        """
+        with self._cond:
+            if self._can_enter(hit):
+                self._active += 1
+                return True
+
+            if self._waiting_hits + len(self._waiting_misses) >= self.queue:
+                if not hit or not self._waiting_misses:
+                    return False
+
+                self._waiting_misses.pop().evicted = True
+                self._cond.notify_all()
+
+            if hit:
+                self._waiting_hits += 1
+
+                try:
+                    admitted = self._cond.wait_for(
+                        lambda: self._can_enter(True), timeout=self.timeout
+                    )
+                finally:
+                    self._waiting_hits -= 1
+            else:
+                waiter = _Waiter()
+                self._waiting_misses.append(waiter)
+
+                try:
+                    admitted = self._cond.wait_for(
+                        lambda: waiter.evicted or self._can_enter(False),
+                        timeout=self.timeout,
+                    )
+                finally:
+                    if not waiter.evicted:
+                        self._waiting_misses.remove(waiter)
+
+                admitted = admitted and not waiter.evicted
+
+            if admitted:
+                self._active += 1
+            else:
+                self._cond.notify_all()
+
+            return admitted
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+
+class AdmissionControl:
+    """
+    Limits the concurrent requests of each route class configured in
+    `settings.ADMISSION`. Requests over the limit wait in a bounded queue,
+    and get an early 503 with Retry-After once the queue is full or their
+    wait times out. Routes outside every class are not limited.
+
+    Classes are given threads in order, out of the `settings.THREADS` left
+    by the feed subscribers. A class that has no concurrency or does not fit
+    in the remaining threads (e.g. with the few threads of a development
+    server) is not limited, and a warning is logged.
+    """
+
+    def __init__(self, app: t.Callable):
+        self.app = app
+        self.classes = []
+
+        available = settings.THREADS - settings.FEED_MAX_CONNECTIONS
+
+        for name, config in settings.ADMISSION.items():
+            reserved = config['concurrency'] + config['queue']
+
+            if config['concurrency'] < 1 or reserved > available:
+                logger.warning(
+                    'Not limiting the %s routes: %s threads left for %s '
+                    'running and %s queued requests',
+                    name,
+                    available,
+                    config['concurrency'],
+                    config['queue'],
+                )
+                continue
+
+            available -= reserved
+            self.classes.append(
+                (
+                    tuple(config['prefixes']),
+                    AdmissionLimiter(
+                        config['concurrency'],
+                        config['queue'],
+                        config['timeout'],
+                    ),
+                    str(config['retry_after']),
+                )
+            )
+
+    def route_class(self, path: str) -> tuple[AdmissionLimiter, str] | None:
+        """
+        Returns the limiter and Retry-After value of the route class the path
+        belongs to, if any.
+        """
+        for prefixes, limiter, retry_after in self.classes:
+            if path.startswith(prefixes):
+                return limiter, retry_after
+
+        return None
+
+    @staticmethod
+    @inject
+    def is_cache_hit(
+        env: dict, listing: ListingService, catalog: CatalogService
+    ) -> bool:
+        """
+        Whether the request will be served from the listing cache or the
+        catalog, without reaching upstream.
+        """
+        path = env.get('PATH_INFO', '/')
+
+        if path.startswith('/v1/mangas/'):
+            return catalog.has_info(path.rsplit('/', 1)[-1])
+
+        if path != '/v1/mangas':
+            return False
+
+        query = Request(env).query
+
+        if not query:
+            return listing.cached(None, 1)
+
+        try:
+            first = last = query.get('page', default=1, type=int)
+            fields = utils.parse_fields(
+                query.get('fields', type=str), LISTING_FIELDS
+            )
+
+            if pages := query.get('pages', type=str):
+                first, last = utils.parse_page_range(
+                    pages, settings.LISTING_MAX_PAGES
+                )
+        except (
+            exceptions.InvalidFields,
+            exceptions.InvalidPageRange,
+            TypeError,
+            ValueError,
+        ):
+            return False
+
+        return listing.cached(query.get('q', type=str), first, last, fields)
+
+    def __call__(
+        self, env: dict, start_response: t.Callable
+    ) -> t.Iterable[bytes]:
+        route_class = self.route_class(env.get('PATH_INFO', '/'))
+
+        if route_class is None:
+            yield from self.app(env, start_response)
+            return
+
+        limiter, retry_after = route_class
+
+        if not limiter.acquire(self.is_cache_hit(env)):
+            data, status, headers = utils.error_response(
+                status_code=503,
+                message='Server is busy, try again later.',
+                exception_code='SERVICE_UNAVAILABLE',
+                headers={'retry-after': retry_after},
+            ).get_response()
+            start_response(status, headers)
+            yield data
+            return
+
+        try:
+            yield from self.app(env, start_response)
+        finally:
+            limiter.release()
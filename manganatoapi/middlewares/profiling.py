@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import random
+import re
+import sys
+import threading
+import time
+import typing as t
+from collections import Counter
+
+from .. import settings
+
+if t.TYPE_CHECKING:
+    from types import FrameType
+
+    from restcraft.core.application import RestCraft
+
+
+class StackSampler(threading.Thread):
+    """
+    Samples the call stack of another thread at a fixed interval and counts
+    the collapsed stacks, as used by flamegraph tools.
+
+    The sampler stops by itself after `max_duration` seconds, so a request
+    that never reaches `stop` does not keep it running.
+    """
+
+    def __init__(self, thread_id: int, interval: float, max_duration: float):
+        super().__init__(name='profiler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.max_duration = max_duration
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+
+    @staticmethod
+    def collapse(frame: FrameType | None) -> str:
+        """
+        Converts a frame into a semicolon separated stack, root first.
+        """
+        names = []
+
+        while frame is not None:
+            code = frame.f_code
+            filename = os.path.basename(code.co_filename)
+            names.append(f'{code.co_name} ({filename}:{code.co_firstlineno})')
+            frame = frame.f_back
+
+        return ';'.join(reversed(names))
+
+    def run(self) -> None:
+        deadline = time.monotonic() + self.max_duration
+
+        while not self._stopped.wait(self.interval):
+            if time.monotonic() > deadline:
+                break
+
+            frame = sys._current_frames().get(self.thread_id)
+
+            if frame is not None:
+                self.stacks[self.collapse(frame)] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+class RequestProfiler:
+    """
+    Profiles opt-in requests with a sampling profiler and dumps the collapsed
+    stacks to `settings.PROFILE_DIR`.
+
+    A request is profiled when it is picked by `settings.PROFILE_SAMPLE_RATE`
+    or when it sends the `x-profile` header matching `settings.PROFILE_TOKEN`.
+    The dump file name carries the route and the time until the response
+    headers, and is returned in the `x-profile` response header.
+
+    This is a WSGI middleware rather than a RestCraft `Middleware`: RestCraft
+    skips `after_handler` when a view fails, and failing or timing out
+    requests are the ones most worth profiling. The profile is dumped once
+    the response body has been sent, whatever happened to the request.
+    """
+
+    def __init__(self, app: RestCraft):
+        self.app = app
+
+    def _should_profile(self, env: dict) -> bool:
+        token = settings.PROFILE_TOKEN
+
+        if token and env.get('HTTP_X_PROFILE') == token:
+            return True
+
+        rate = settings.PROFILE_SAMPLE_RATE
+
+        return rate > 0 and random.random() < rate
+
+    def _filename(self, env: dict, elapsed: float) -> str:
+        """
+        Returns the dump file name of a request, named after its route, or
+        its path when it matches none.
+        """
+        method = env.get('REQUEST_METHOD', 'GET').upper()
+        path = env.get('PATH_INFO', '/')
+
+        try:
+            route, _ = self.app.route_manager.resolve(method, path)
+            path = route.view.route
+        except Exception:
+            pass
+
+        route = re.sub(r'[^a-zA-Z0-9]+', '_', path).rstrip('_')
+
+        return (
+            f'{time.strftime("%Y%m%dT%H%M%S")}_{method}{route}'
+            f'_{elapsed * 1000:.0f}ms.folded'
+        )
+
+    @staticmethod
+    def _dump(filename: str, sampler: StackSampler) -> None:
+        os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+
+        with open(os.path.join(settings.PROFILE_DIR, filename), 'w') as f:
+            for stack, count in sampler.stacks.items():
+                f.write(f'{stack} {count}\n')
+
+    def __call__(
+        self, env: dict, start_response: t.Callable
+    ) -> t.Iterable[bytes]:
+        if not self._should_profile(env):
+            yield from self.app(env, start_response)
+            return
+
+        sampler = StackSampler(
+            threading.get_ident(),
+            settings.PROFILE_INTERVAL,
+            settings.PROFILE_MAX_DURATION,
+        )
+        started = time.perf_counter()
+        filename = None
+
+        def profiled_start_response(status, headers, exc_info=None):
+            nonlocal filename
+            filename = self._filename(env, time.perf_counter() - started)
+            headers.append(('x-profile', filename))
+            return start_response(status, headers, exc_info)
+
+        sampler.start()
+
+        try:
+            yield from self.app(env, profiled_start_response)
+        finally:
+            sampler.stop()
+            self._dump(
+                filename or self._filename(env, time.perf_counter() - started),
+                sampler,
+            )
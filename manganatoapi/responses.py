@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import typing as t
+
+from restcraft.core import Response
+
+
+class EventStreamResponse(Response):
+    """
+    Represents a Server-Sent Events response, streaming the events yielded by
+    a generator of encoded chunks.
+    """
+
+    default_headers = {
+        'content-type': 'text/event-stream; charset=utf-8',
+        'cache-control': 'no-cache',
+        'x-accel-buffering': 'no',
+    }
+
+    def __init__(
+        self,
+        events: t.Generator[bytes, None, None],
+        *,
+        headers: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> None:
+        super().__init__(body=events, headers=headers)
+
+    def get_response(
+        self,
+    ) -> t.Tuple[
+        t.Generator[bytes, None, None], str, t.List[t.Tuple[str, str]]
+    ]:
+        """
+        Returns the event generator without a content-length, as the stream
+        has no fixed size.
+        """
+        return self._body, self.status_line, self.header_list
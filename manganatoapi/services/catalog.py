@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import typing as t
+
+from .. import settings
+
+if t.TYPE_CHECKING:
+    import sqlite3
+
+CATALOG_PAGE_SIZE = 24
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mangas (
+    id TEXT PRIMARY KEY,
+    rank INTEGER NOT NULL,
+    last_chapter TEXT,
+    listing TEXT NOT NULL,
+    info TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS mangas_rank ON mangas (rank DESC);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class CatalogService:
+    """
+    Local store of the precomputed manga catalog filled by the crawler.
+
+    Listing entries are ordered by ``rank``, where newer crawl runs always
+    rank above older ones and, inside a run, entries keep the order in which
+    they were found on the upstream listing.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or settings.CATALOG_DB
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        if self.path:
+            with self._write_lock:
+                self.connection.executescript(_SCHEMA)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether a catalog database is configured.
+        """
+        return bool(self.path)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns the SQLite connection bound to the current thread.
+        """
+        import sqlite3
+
+        conn = getattr(self._local, 'conn', None)
+
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+
+        return conn
+
+    def updates(self, page: int):
+        """
+        Returns a page of the stored listing, in the same format as
+        `MangaService.updates`.
+
+        Args:
+            page (int): The page number to retrieve.
+
+        Returns:
+            list[dict] | None: The stored listing entries, or `None` if the
+                catalog is disabled or does not reach that page.
+        """
+        if not self.enabled:
+            return None
+
+        rows = self.connection.execute(
+            'SELECT listing FROM mangas ORDER BY rank DESC LIMIT ? OFFSET ?',
+            (CATALOG_PAGE_SIZE, (max(page, 1) - 1) * CATALOG_PAGE_SIZE),
+        ).fetchall()
+
+        if not rows:
+            return None
+
+        return [json.loads(listing) for (listing,) in rows]
+
+    def info(self, manga_id: str):
+        """
+        Returns the stored details of a manga, in the same format as
+        `MangaService.info`.
+
+        Args:
+            manga_id (str): The manga identifier, e.g. ``mu-manga-aa951409``.
+
+        Returns:
+            dict | None: The stored details, or `None` if unavailable.
+        """
+        if not self.enabled:
+            return None
+
+        row = self.connection.execute(
+            'SELECT info FROM mangas WHERE id = ?', (manga_id,)
+        ).fetchone()
+
+        if not row or row[0] is None:
+            return None
+
+        return json.loads(row[0])
+
+    def has_info(self, manga_id: str) -> bool:
+        """
+        Whether the details of a manga are stored.
+
+        Args:
+            manga_id (str): The manga identifier.
+
+        Returns:
+            bool: `True` if `info` would return the stored details.
+        """
+        if not self.enabled:
+            return False
+
+        row = self.connection.execute(
+            'SELECT 1 FROM mangas WHERE id = ? AND info IS NOT NULL',
+            (manga_id,),
+        ).fetchone()
+
+        return row is not None
+
+    def last_chapter(self, manga_id: str):
+        """
+        Returns the last chapter recorded for a manga.
+
+        Args:
+            manga_id (str): The manga identifier.
+
+        Returns:
+            tuple[bool, str | None]: Whether the manga has stored details,
+                and its last recorded chapter title.
+        """
+        row = self.connection.execute(
+            'SELECT info IS NOT NULL, last_chapter FROM mangas WHERE id = ?',
+            (manga_id,),
+        ).fetchone()
+
+        if not row:
+            return False, None
+
+        return bool(row[0]), row[1]
+
+    def save(
+        self,
+        manga_id: str,
+        rank: int,
+        listing: dict[str, t.Any],
+        info: dict[str, t.Any] | None = None,
+    ) -> None:
+        """
+        Inserts or updates a catalog entry. When `info` is omitted, the
+        previously stored details and last chapter are kept, so that a
+        manga whose details could not be fetched is fetched again by the
+        next crawl.
+
+        Args:
+            manga_id (str): The manga identifier.
+            rank (int): The listing position of the entry.
+            listing (dict): The listing entry as returned by
+                `MangaService.updates`.
+            info (dict, optional): The details as returned by
+                `MangaService.info`.
+        """
+        with self._write_lock, self.connection as conn:
+            conn.execute(
+                'INSERT INTO mangas '
+                '(id, rank, last_chapter, listing, info, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (id) DO UPDATE SET '
+                'rank = excluded.rank, '
+                'last_chapter = CASE WHEN excluded.info IS NULL '
+                'THEN mangas.last_chapter ELSE excluded.last_chapter END, '
+                'listing = excluded.listing, '
+                'info = COALESCE(excluded.info, mangas.info), '
+                'updated_at = excluded.updated_at',
+                (
+                    manga_id,
+                    rank,
+                    listing.get('last_chapter'),
+                    json.dumps(listing),
+                    json.dumps(info) if info is not None else None,
+                    time.time(),
+                ),
+            )
+
+    def get_state(self, key: str, default: str | None = None):
+        """
+        Returns a crawler state value.
+        """
+        row = self.connection.execute(
+            'SELECT value FROM state WHERE key = ?', (key,)
+        ).fetchone()
+
+        return row[0] if row else default
+
+    def set_state(self, key: str, value: str | None) -> None:
+        """
+        Stores a crawler state value. A `None` value removes the key.
+        """
+        with self._write_lock, self.connection as conn:
+            if value is None:
+                conn.execute('DELETE FROM state WHERE key = ?', (key,))
+            else:
+                conn.execute(
+                    'INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)',
+                    (key, value),
+                )
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import logging
+import secrets
+import threading
+import time
+import typing as t
+from collections import deque
+from functools import partial
+
+from restcraft.core.di import inject
+
+from .. import settings, utils
+
+if t.TYPE_CHECKING:
+    from .manga import MangaService
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class FeedService:
+    """
+    Watches the latest updates listing and publishes what changed to the
+    Server-Sent Events subscribers.
+
+    A single watcher thread per worker scrapes the first updates page every
+    `settings.FEED_INTERVAL` seconds and diffs it against the previous
+    snapshot by URL and last chapter. Changes are kept in a short shared
+    backlog, so each subscriber only holds the id of the last event it sent.
+
+    The snapshot and backlog belong to the worker, so event ids are only
+    meaningful to the worker that sent them: they are prefixed with a random
+    worker tag, and a `Last-Event-ID` from another worker (or a restarted
+    one) resumes from the latest event instead.
+    """
+
+    _events: deque[tuple[int, bytes]] = deque(maxlen=settings.FEED_BACKLOG)
+    _cond = threading.Condition()
+    _snapshot: dict[str, t.Any] | None = None
+    _thread: threading.Thread | None = None
+    _worker: str | None = None
+    _subscribers = 0
+
+    @classmethod
+    def _ensure_started(cls) -> None:
+        """
+        Starts the watcher thread on first use, so that no threads are
+        started before the workers fork.
+        """
+        with cls._cond:
+            if cls._thread is None:
+                cls._worker = secrets.token_hex(4)
+                cls._thread = threading.Thread(
+                    target=cls._watch, name='feed', daemon=True
+                )
+                cls._thread.start()
+
+    @classmethod
+    def _watch(cls) -> None:
+        while True:
+            try:
+                cls.poll()
+            except Exception:
+                logger.exception('Failed to poll the latest updates')
+
+            time.sleep(settings.FEED_INTERVAL)
+
+    @classmethod
+    @inject
+    def poll(cls, manga: MangaService) -> None:
+        """
+        Scrapes the latest updates and publishes the changes.
+        """
+        changes = cls.diff(manga.updates(1))
+
+        if changes:
+            cls.publish(changes)
+
+    @classmethod
+    def diff(cls, entries: list[dict[str, t.Any]]) -> list[dict[str, t.Any]]:
+        """
+        Replaces the snapshot with the provided entries and returns the
+        entries that are new or have a different last chapter. The first
+        snapshot yields no changes.
+
+        Args:
+            entries (list[dict]): The latest updates entries.
+
+        Returns:
+            list[dict]: The new or updated entries.
+        """
+        snapshot = {e['url']: e['last_chapter'] for e in entries}
+        previous, cls._snapshot = cls._snapshot, snapshot
+
+        if previous is None:
+            return []
+
+        return [
+            e
+            for e in entries
+            if previous.get(e['url'], _MISSING) != e['last_chapter']
+        ]
+
+    @classmethod
+    def publish(cls, changes: list[dict[str, t.Any]]) -> None:
+        """
+        Appends an event with the changes to the backlog and wakes up the
+        subscribers.
+        """
+        data = json.dumps(
+            [utils.snake_to_camel(change) for change in changes]
+        ).encode()
+
+        with cls._cond:
+            last = cls._events[-1][0] if cls._events else 0
+            cls._events.append((last + 1, data))
+            cls._cond.notify_all()
+
+    @classmethod
+    def _has_events_after(cls, event_id: int) -> bool:
+        return bool(cls._events) and cls._events[-1][0] > event_id
+
+    @classmethod
+    def _resume_from(cls, last_event_id: str | None) -> int:
+        """
+        Returns the sequence number to stream after, from the `Last-Event-ID`
+        sent by the client.
+        """
+        worker, _, seq = (last_event_id or '').partition('-')
+
+        if worker == cls._worker and seq.isdigit():
+            return int(seq)
+
+        return cls._events[-1][0] if cls._events else 0
+
+    @classmethod
+    def _release(cls) -> None:
+        with cls._cond:
+            cls._subscribers -= 1
+
+    @classmethod
+    def subscribe(
+        cls, last_event_id: str | None = None
+    ) -> t.Generator[bytes, None, None] | None:
+        """
+        Reserves a subscriber slot and returns the update events stream, or
+        `None` if `settings.FEED_MAX_CONNECTIONS` subscribers are already
+        streaming.
+
+        The slot is freed when the stream ends or is closed. The stream is
+        started before being returned, so the slot is also freed when the
+        server drops it without iterating it (e.g. for HEAD requests).
+
+        Args:
+            last_event_id (str, optional): The id of the last event received
+                by the client.
+
+        Returns:
+            Generator[bytes] | None: The event stream.
+        """
+        with cls._cond:
+            if cls._subscribers >= settings.FEED_MAX_CONNECTIONS:
+                return None
+            cls._subscribers += 1
+
+        try:
+            cls._ensure_started()
+            stream = cls._stream(cls._resume_from(last_event_id))
+        except BaseException:
+            cls._release()
+            raise
+
+        return _prepend(next(stream), stream)
+
+    @classmethod
+    def _stream(cls, last_event_id: int) -> t.Generator[bytes, None, None]:
+        """
+        Streams the update events as Server-Sent Events, starting after
+        `last_event_id` when it is still in the backlog. The stream ends
+        after `settings.FEED_MAX_DURATION` seconds, and clients reconnect
+        with their last event id.
+
+        Args:
+            last_event_id (int): The sequence number of the last event sent
+                to the client.
+
+        Yields:
+            bytes: The encoded events and keep-alive comments.
+        """
+        deadline = time.monotonic() + settings.FEED_MAX_DURATION
+
+        try:
+            yield b'retry: 3000\n\n'
+
+            while time.monotonic() < deadline:
+                with cls._cond:
+                    cls._cond.wait_for(
+                        partial(cls._has_events_after, last_event_id),
+                        timeout=settings.FEED_HEARTBEAT,
+                    )
+                    pending = [e for e in cls._events if e[0] > last_event_id]
+
+                if not pending:
+                    yield b': keep-alive\n\n'
+                    continue
+
+                for event_id, data in pending:
+                    yield b'id: %s-%d\nevent: updates\ndata: %s\n\n' % (
+                        cls._worker.encode(),
+                        event_id,
+                        data,
+                    )
+                    last_event_id = event_id
+        finally:
+            cls._release()
+
+
+def _prepend(
+    first: bytes, stream: t.Generator[bytes, None, None]
+) -> t.Generator[bytes, None, None]:
+    yield first
+    yield from stream
@@ -6,7 +6,7 @@ from urllib.parse import unquote, urlparse
 
 from restcraft.core.di import inject
 
-from .. import utils
+from .urls import UrlService
 
 if t.TYPE_CHECKING:
     from .request import RequestService
@@ -17,11 +17,11 @@ class ImageService:
     @inject
     def get(cls, encoded_url: str, request: RequestService):
         """
-        Retrieves the image file and its metadata from the provided encoded
-        URL.
+        Retrieves the image file and its metadata from the provided image ID
+        or encoded URL.
 
         Args:
-            encoded_url (str): The encoded URL of the image to retrieve.
+            encoded_url (str): The ID or encoded URL of the image to retrieve.
 
         Returns:
             tuple: A tuple containing the following:
@@ -31,7 +31,7 @@ class ImageService:
                 - stream (generator): A generator that yields the image data in
                     chunks.
         """
-        url = utils.decode_url(encoded_url)
+        url = UrlService.decode(encoded_url)
         parsed_url = urlparse(url)
 
         stream = request.stream(url)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from restcraft.core.di import inject
+
+from .. import settings, utils
+from ..exceptions import NotFound
+
+if t.TYPE_CHECKING:
+    from .catalog import CatalogService
+    from .manga import MangaService
+
+
+class ListingService:
+    """
+    Serves listing pages (latest updates or search results) through a short
+    lived in-memory cache of fetches.
+
+    Cache entries are futures, so concurrent requests for the same page share
+    a single upstream fetch, page ranges are fetched in parallel, and the
+    page after the last one served is prefetched in the background. Pages
+    are cached per set of requested fields, so that only those fields are
+    extracted.
+    """
+
+    _cache: OrderedDict[
+        tuple[str | None, int, frozenset[str] | None], tuple[float, Future]
+    ] = OrderedDict()
+    _lock = threading.Lock()
+    _executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Returns the executor used for page fetches, creating it on first use
+        so that no threads are started before the workers fork.
+        """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.LISTING_WORKERS,
+                thread_name_prefix='listing',
+            )
+        return cls._executor
+
+    @classmethod
+    @inject
+    def fetch(
+        cls,
+        query: str | None,
+        page: int,
+        manga: MangaService,
+        catalog: CatalogService,
+        fields: frozenset[str] | None = None,
+    ):
+        """
+        Fetches a single listing page, from the catalog when available.
+
+        Args:
+            query (str | None): The search query, or `None` for the latest
+                updates.
+            page (int): The page number to retrieve.
+            fields (frozenset[str], optional): The keys to extract for each
+                manga. All keys are extracted when not set.
+
+        Returns:
+            list[dict]: The listing entries.
+        """
+        if query:
+            return manga.search(query, page, fields=fields)
+
+        updates = catalog.updates(page)
+
+        if updates is not None:
+            return utils.filter_fields(updates, fields)
+
+        return manga.updates(page, fields=fields)
+
+    @staticmethod
+    def _extracted(fields: frozenset[str] | None) -> frozenset[str] | None:
+        """
+        Returns the keys to extract for the requested fields, which always
+        include the URL, as pages are merged by manga URL.
+        """
+        return fields | {'url'} if fields is not None else None
+
+    @classmethod
+    def _future(
+        cls, query: str | None, page: int, fields: frozenset[str] | None
+    ) -> Future:
+        """
+        Returns the cached fetch of a page, starting a new one if there is
+        none, it expired, or it failed.
+        """
+        key = (query, page, fields)
+        now = time.monotonic()
+
+        with cls._lock:
+            entry = cls._cache.get(key)
+
+            if entry is not None:
+                expires, future = entry
+                failed = future.done() and future.exception() is not None
+
+                if expires > now and not failed:
+                    cls._cache.move_to_end(key)
+                    return future
+
+            future = cls._get_executor().submit(
+                cls.fetch, query, page, fields=fields
+            )
+            cls._cache[key] = (now + settings.LISTING_CACHE_TTL, future)
+            cls._cache.move_to_end(key)
+
+            while len(cls._cache) > settings.LISTING_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+
+        return future
+
+    @classmethod
+    def cached(
+        cls,
+        query: str | None,
+        first: int,
+        last: int | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> bool:
+        """
+        Whether every page of the range has already been fetched with the
+        same fields and has not expired.
+        """
+        fields = cls._extracted(fields)
+        now = time.monotonic()
+
+        with cls._lock:
+            for page in range(first, (last or first) + 1):
+                entry = cls._cache.get((query, page, fields))
+
+                if entry is None:
+                    return False
+
+                expires, future = entry
+
+                if expires <= now or not future.done() or future.exception():
+                    return False
+
+        return True
+
+    @classmethod
+    def get(
+        cls,
+        query: str | None,
+        first: int,
+        last: int | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> list[dict[str, t.Any]]:
+        """
+        Retrieves a page, or a range of pages merged and de-duplicated by
+        manga URL, and prefetches the following page.
+
+        Args:
+            query (str | None): The search query, or `None` for the latest
+                updates.
+            first (int): The first page to retrieve.
+            last (int, optional): The last page to retrieve, defaults to
+                `first`.
+            fields (frozenset[str], optional): The keys to extract for each
+                manga. All keys are extracted when not set.
+
+        Returns:
+            list[dict]: The listing entries.
+
+        Raises:
+            NotFound: If the first page does not exist.
+        """
+        last = last or first
+        extracted = cls._extracted(fields)
+        futures = [
+            cls._future(query, page, extracted)
+            for page in range(first, last + 1)
+        ]
+
+        cls._future(query, last + 1, extracted)
+
+        result = []
+        seen = set()
+
+        for page, future in enumerate(futures, start=first):
+            try:
+                entries = future.result()
+            except NotFound:
+                if page == first:
+                    raise
+                break
+
+            for entry in entries:
+                if entry['url'] in seen:
+                    continue
+                seen.add(entry['url'])
+                result.append(entry)
+
+        return utils.filter_fields(result, fields)
@@ -4,12 +4,15 @@ import re
 import typing as t
 from urllib.parse import urljoin
 
-from parsel import Selector, SelectorList
 from restcraft.core.di import inject
 
 from .. import utils
+from .urls import UrlService
 
 if t.TYPE_CHECKING:
+    from parsel import Selector, SelectorList
+
+    from .parser import ParserService
     from .request import RequestService
 
 
@@ -20,14 +23,54 @@ MANGA_INFO_URL_PREFIX = {
     'mu': 'https://manganato.com',
 }
 
+# Keys that can be requested with `fields`.
+LISTING_FIELDS = frozenset(
+    ('url', 'cover', 'title', 'author', 'views', 'last_chapter', 'last_update')
+)
+
+INFO_FIELDS = frozenset(
+    (
+        'title',
+        'cover',
+        'genres',
+        'status',
+        'author',
+        'views',
+        'last_update',
+        'description',
+        'chapters',
+    )
+)
+
+# Start and end markers of the content parsed from each page, the rest of
+# the page is not downloaded.
+UPDATES_CONTENT = (b'content-genres-item', b'panel-page-number')
+
+INFO_CONTENT = (b'row-content-chapter', b'</ul>')
+
+IMAGES_CONTENT = (b'container-chapter-reader', b'panel-navigation')
+
+SEARCH_CONTENT = (b'search-story-item', b'panel-page-number')
+
 
 class MangaService:
     @classmethod
     @inject
-    def updates(cls, page: int, request: RequestService):
+    def updates(
+        cls,
+        page: int,
+        request: RequestService,
+        parser: ParserService,
+        fields: t.Container[str] | None = None,
+    ):
         """
         Retrieves a list of recently updated manga from the Manganato website.
 
+        Args:
+            page (int): The page number to retrieve.
+            fields (Container[str], optional): The keys to extract for each
+                manga. All keys are extracted when not set.
+
         Returns:
             list[dict]: A list of dictionaries, where each dictionary
                 represents a manga and contains the following keys:
@@ -40,13 +83,36 @@ class MangaService:
                 - 'last_update': The date the manga was last updated.
                 - 'author': The name of the manga's author.
         """
-        base_url = '/mangas/'
-
         resp = request.get(
-            MANGA_UPDATES_URL + f'{"/%s" % page if page > 1 else ""}'
+            MANGA_UPDATES_URL + f'{"/%s" % page if page > 1 else ""}',
+            until=UPDATES_CONTENT,
+        )
+
+        return parser.parse(
+            'MangaService.updates', cls._parse_updates, resp, fields
         )
 
-        select = utils.get_selector(resp.text)
+    @classmethod
+    def _parse_updates(
+        cls,
+        html: bytes,
+        encoding: str,
+        fields: t.Container[str] | None = None,
+    ):
+        """
+        Parses the latest updates listing page.
+
+        Args:
+            html (bytes): The raw listing page.
+            encoding (str): The encoding of the page.
+            fields (Container[str], optional): The keys to extract.
+
+        Returns:
+            list[dict]: The manga entries, see `updates`.
+        """
+        base_url = '/mangas/'
+
+        select = utils.get_selector(html, encoding)
 
         result = []
 
@@ -56,6 +122,19 @@ class MangaService:
             if not url:
                 continue
 
+            result.append(cls._updates_item(manga, url, fields))
+
+        return result
+
+    @classmethod
+    def _updates_item(
+        cls, manga: Selector, url: str, fields: t.Container[str] | None
+    ):
+        """
+        Extracts the requested keys of a latest updates listing entry.
+        """
+
+        def author():
             author = manga.xpath(
                 './/span[@class="genres-item-author"]/text()'
             ).get()
@@ -63,25 +142,26 @@ class MangaService:
             if author:
                 author = utils.strip_list(author.split(','))
 
-            result.append(
-                {
-                    'url': url,
-                    'cover': manga.xpath('.//img/@src').get(),
-                    'title': manga.xpath('.//h3/a/text()').get(),
-                    'author': author,
-                    'views': manga.xpath(
-                        './/span[@class="genres-item-view"]/text()'
-                    ).get(),
-                    'last_chapter': manga.xpath(
-                        './/a[contains(@class, "genres-item-chap")]/text()'
-                    ).get(),
-                    'last_update': manga.xpath(
-                        './/span[@class="genres-item-time"]/text()'
-                    ).get(),
-                }
-            )
-
-        return result
+            return author
+
+        return utils.pick_fields(
+            {
+                'url': lambda: url,
+                'cover': lambda: manga.xpath('.//img/@src').get(),
+                'title': lambda: manga.xpath('.//h3/a/text()').get(),
+                'author': author,
+                'views': lambda: manga.xpath(
+                    './/span[@class="genres-item-view"]/text()'
+                ).get(),
+                'last_chapter': lambda: manga.xpath(
+                    './/a[contains(@class, "genres-item-chap")]/text()'
+                ).get(),
+                'last_update': lambda: manga.xpath(
+                    './/span[@class="genres-item-time"]/text()'
+                ).get(),
+            },
+            fields,
+        )
 
     @classmethod
     def _process_chapters(cls, chapters: SelectorList[Selector]):
@@ -100,29 +180,35 @@ class MangaService:
                 - 'title': The title of the chapter.
                 - 'number': The chapter number.
         """
-        result = []
+        found = []
 
         for ch in chapters:
             ch_url = ch.xpath('./@href').get()
 
-            if not ch_url:
-                continue
+            if ch_url:
+                found.append((ch, ch_url))
 
-            ch_url_encoded = utils.encode_url(ch_url)
+        ids = UrlService.encode_many([ch_url for _, ch_url in found])
 
-            result.append(
-                {
-                    'url': f'/chapters/{ch_url_encoded}',
-                    'title': ch.xpath('./text()').get(),
-                    'number': utils.get_chapter_number(ch_url),
-                }
-            )
-
-        return result
+        return [
+            {
+                'url': f'/chapters/{ch_id}',
+                'title': ch.xpath('./text()').get(),
+                'number': utils.get_chapter_number(ch_url),
+            }
+            for (ch, ch_url), ch_id in zip(found, ids, strict=True)
+        ]
 
     @classmethod
     @inject
-    def info(cls, manga: str, prefix: str, request: RequestService):
+    def info(
+        cls,
+        manga: str,
+        prefix: str,
+        request: RequestService,
+        parser: ParserService,
+        fields: t.Container[str] | None = None,
+    ):
         """
         Retrieves information about a manga based on the provided manga name
         and prefix.
@@ -130,6 +216,8 @@ class MangaService:
         Args:
             manga (str): The name of the manga to retrieve information for.
             prefix (str): The prefix to use for the manga information URL.
+            fields (Container[str], optional): The keys to extract. All keys
+                are extracted when not set.
 
         Returns:
             dict: A dictionary containing the following keys:
@@ -149,54 +237,80 @@ class MangaService:
                     - 'number': The chapter number.
         """
         url = urljoin(MANGA_INFO_URL_PREFIX[prefix], manga)
-        resp = request.get(url)
-        select = utils.get_selector(resp.text)
-
-        return {
-            'title': select(
-                "//div[@class='story-info-right']/h1/text()"
-            ).get(),
-            'cover': select(
-                "//span[contains(@class, 'info-image')]//img/@src"
-            ).get(),
-            'genres': select(
-                "//td[text()='Genres :']/following-sibling::td/a/text()"
-            ).getall(),
-            'status': select(
-                "//td[text()='Status :']/following-sibling::td/text()"
-            ).get(),
-            'author': select(
-                "//td[text()='Author(s) :']/following-sibling::td/a/text()"
-            ).getall(),
-            'views': select(
-                "//div[@class='story-info-right-extent']"
-                "//span[text()='View :']/following-sibling::span/text()"
-            ).get(),
-            'last_update': select(
-                "//div[@class='story-info-right-extent']"
-                "//span[text()='Updated :']/following-sibling::span/text()"
-            ).get(),
-            'description': utils.normalize_text(
-                ''.join(
-                    select(
-                        '//div[contains(@class, '
-                        "'panel-story-info-description')]//text()"
-                    ).getall()
-                )
-            ),
-            'chapters': cls._process_chapters(
-                select("//ul[contains(@class, 'row-content-chapter')]//a")
-            ),
-        }
+        resp = request.get(url, until=INFO_CONTENT)
+
+        return parser.parse('MangaService.info', cls._parse_info, resp, fields)
+
+    @classmethod
+    def _parse_info(
+        cls,
+        html: bytes,
+        encoding: str,
+        fields: t.Container[str] | None = None,
+    ):
+        """
+        Parses a manga page.
+
+        Args:
+            html (bytes): The raw manga page.
+            encoding (str): The encoding of the page.
+            fields (Container[str], optional): The keys to extract.
+
+        Returns:
+            dict: The manga information, see `info`.
+        """
+        select = utils.get_selector(html, encoding)
+
+        return utils.pick_fields(
+            {
+                'title': lambda: select(
+                    "//div[@class='story-info-right']/h1/text()"
+                ).get(),
+                'cover': lambda: select(
+                    "//span[contains(@class, 'info-image')]//img/@src"
+                ).get(),
+                'genres': lambda: select(
+                    "//td[text()='Genres :']/following-sibling::td/a/text()"
+                ).getall(),
+                'status': lambda: select(
+                    "//td[text()='Status :']/following-sibling::td/text()"
+                ).get(),
+                'author': lambda: select(
+                    "//td[text()='Author(s) :']/following-sibling::td/a/text()"
+                ).getall(),
+                'views': lambda: select(
+                    "//div[@class='story-info-right-extent']"
+                    "//span[text()='View :']/following-sibling::span/text()"
+                ).get(),
+                'last_update': lambda: select(
+                    "//div[@class='story-info-right-extent']"
+                    "//span[text()='Updated :']/following-sibling::span/text()"
+                ).get(),
+                'description': lambda: utils.normalize_text(
+                    ''.join(
+                        select(
+                            '//div[contains(@class, '
+                            "'panel-story-info-description')]//text()"
+                        ).getall()
+                    )
+                ),
+                'chapters': lambda: cls._process_chapters(
+                    select("//ul[contains(@class, 'row-content-chapter')]//a")
+                ),
+            },
+            fields,
+        )
 
     @classmethod
     @inject
-    def images(cls, chapter: str, request: RequestService):
+    def images(
+        cls, chapter: str, request: RequestService, parser: ParserService
+    ):
         """
         Retrieves the image URLs for a given chapter of a manga.
 
         Args:
-            chapter (str): The URL of the chapter page.
+            chapter (str): The ID of the chapter page.
 
         Returns:
             list[dict]: A list of dictionaries, where each dictionary
@@ -204,29 +318,55 @@ class MangaService:
                 - 'order': The order of the image in the chapter.
                 - 'url': The URL of the image.
         """
-        decoded_url = utils.decode_url(chapter)
-        resp = request.get(decoded_url)
-        select = utils.get_selector(resp.text)
+        decoded_url = UrlService.decode(chapter)
+        resp = request.get(decoded_url, until=IMAGES_CONTENT)
+
+        return parser.parse('MangaService.images', cls._parse_images, resp)
+
+    @classmethod
+    def _parse_images(cls, html: bytes, encoding: str):
+        """
+        Parses a chapter page.
+
+        Args:
+            html (bytes): The raw chapter page.
+            encoding (str): The encoding of the page.
+
+        Returns:
+            list[dict]: The chapter images, see `images`.
+        """
+        select = utils.get_selector(html, encoding)
+
+        ids = UrlService.encode_many(
+            select(
+                "//div[contains(@class, 'container-chapter-reader')]"
+                '//img/@src'
+            ).getall()
+        )
 
         return [
-            {'order': i, 'url': f'/images/{utils.encode_url(url)}'}
-            for i, url in enumerate(
-                select(
-                    "//div[contains(@class, 'container-chapter-reader')]"
-                    '//img/@src'
-                ).getall()
-            )
+            {'order': i, 'url': f'/images/{image_id}'}
+            for i, image_id in enumerate(ids)
         ]
 
     @classmethod
     @inject
-    def search(cls, query: str, page: int, request: RequestService):
+    def search(
+        cls,
+        query: str,
+        page: int,
+        request: RequestService,
+        parser: ParserService,
+        fields: t.Container[str] | None = None,
+    ):
         """
         Searches for manga based on the provided query and page number.
 
         Args:
             query (str): The search query.
             page (int): The page number to retrieve.
+            fields (Container[str], optional): The keys to extract for each
+                manga. All keys are extracted when not set.
 
         Returns:
             list[dict]: A list of dictionaries, where each dictionary
@@ -244,8 +384,31 @@ class MangaService:
         if page > 1:
             url += f'?page={page}'
 
-        resp = request.get(url)
-        select = utils.get_selector(resp.text)
+        resp = request.get(url, until=SEARCH_CONTENT)
+
+        return parser.parse(
+            'MangaService.search', cls._parse_search, resp, fields
+        )
+
+    @classmethod
+    def _parse_search(
+        cls,
+        html: bytes,
+        encoding: str,
+        fields: t.Container[str] | None = None,
+    ):
+        """
+        Parses a search results page.
+
+        Args:
+            html (bytes): The raw search results page.
+            encoding (str): The encoding of the page.
+            fields (Container[str], optional): The keys to extract.
+
+        Returns:
+            list[dict]: The manga entries, see `search`.
+        """
+        select = utils.get_selector(html, encoding)
 
         result = []
         for manga in select("//div[@class='search-story-item']"):
@@ -254,6 +417,19 @@ class MangaService:
             if not url:
                 continue
 
+            result.append(cls._search_item(manga, url, fields))
+
+        return result
+
+    @classmethod
+    def _search_item(
+        cls, manga: Selector, url: str, fields: t.Container[str] | None
+    ):
+        """
+        Extracts the requested keys of a search results entry.
+        """
+
+        def last_update():
             last_update = manga.xpath(
                 ".//span[contains(@class, 'item-time')]/text()"
             ).get()
@@ -263,6 +439,9 @@ class MangaService:
                     r'\b[Uu][Pp][Dd][Aa][Tt][Ee][Dd]\s*[:]\s*', '', last_update
                 )
 
+            return last_update
+
+        def views():
             views = manga.xpath(
                 ".//span[contains(@class, 'item-time')][2]/text()"
             ).get()
@@ -270,6 +449,9 @@ class MangaService:
             if views:
                 views = re.sub(r'\b[Vv][Ii][Ee][Ww]\s*[:]\s*', '', views)
 
+            return views
+
+        def author():
             author = manga.xpath(
                 ".//span[contains(@class, 'item-author')]/text()"
             ).get()
@@ -277,15 +459,16 @@ class MangaService:
             if author:
                 author = utils.strip_list(author.split(','))
 
-            result.append(
-                {
-                    'url': url,
-                    'cover': manga.xpath('.//img/@src').get(),
-                    'title': manga.xpath('.//h3/a/text()').get(),
-                    'author': author,
-                    'last_update': last_update,
-                    'views': views,
-                }
-            )
-
-        return result
+            return author
+
+        return utils.pick_fields(
+            {
+                'url': lambda: url,
+                'cover': lambda: manga.xpath('.//img/@src').get(),
+                'title': lambda: manga.xpath('.//h3/a/text()').get(),
+                'author': author,
+                'last_update': last_update,
+                'views': views,
+            },
+            fields,
+        )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .. import settings
+
+if t.TYPE_CHECKING:
+    from .request import Page
+
+T = t.TypeVar('T')
+
+
+class ParserService:
+    """
+    Runs the page parsers either inline or in a process pool.
+
+    Parsing with parsel/lxml holds the GIL, so under thread-based serving
+    large pages serialize every thread on CPU. Parsers named in
+    `settings.PARSE_OFFLOAD` (e.g. ``MangaService.info``) receive the raw
+    page bytes in a worker process instead, leaving the threads free to keep
+    fetching.
+
+    Each serving worker owns a pool of `settings.PARSE_PROCESSES` processes,
+    so keep it small: W workers run W times as many parsing processes. With
+    no processes, every page is parsed inline.
+    """
+
+    _executor: ProcessPoolExecutor | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        """
+        Returns the process pool, creating it on first use. Workers are
+        spawned rather than forked, as the serving process runs threads.
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=settings.PARSE_PROCESSES,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            return cls._executor
+
+    @classmethod
+    def parse(
+        cls,
+        name: str,
+        parse: t.Callable[..., T],
+        page: Page,
+        *args: t.Any,
+    ) -> T:
+        """
+        Parses the provided upstream page. When a pool process dies, the
+        pool is replaced and the page is parsed inline instead.
+
+        Args:
+            name (str): The parser name matched against
+                `settings.PARSE_OFFLOAD`.
+            parse (Callable[..., T]): A picklable function that parses the
+                raw page given its encoding.
+            page (Page): The upstream page.
+            *args: Extra arguments passed to `parse`.
+
+        Returns:
+            T: The parsed result.
+        """
+        if name not in settings.PARSE_OFFLOAD or settings.PARSE_PROCESSES < 1:
+            return parse(page.content, page.encoding, *args)
+
+        executor = cls._get_executor()
+
+        try:
+            return executor.submit(
+                parse, page.content, page.encoding, *args
+            ).result()
+        except BrokenProcessPool:
+            cls._reset_executor(executor)
+
+        return parse(page.content, page.encoding, *args)
+
+    @classmethod
+    def _reset_executor(cls, executor: ProcessPoolExecutor) -> None:
+        """
+        Drops a pool broken by a dead process (e.g. killed when out of
+        memory), so that the next offloaded parse starts a new one.
+        """
+        with cls._lock:
+            if cls._executor is executor:
+                cls._executor = None
+
+        executor.shutdown(wait=False, cancel_futures=True)
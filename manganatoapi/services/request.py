@@ -1,38 +1,350 @@
-import re
+from __future__ import annotations
 
-import requests
+import re
+import threading
+import time
+import typing as t
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from urllib.parse import urlsplit, urlunsplit
 
+from manganatoapi import settings
 from manganatoapi.exceptions import NotFound
 
+if t.TYPE_CHECKING:
+    import requests
+
 _404_NOT_FOUND = re.compile(
-    r'<title>.*404 Not Found.*<\/title>', re.IGNORECASE
+    rb'<title>.*404 Not Found.*<\/title>', re.IGNORECASE
 )
 
+_HEAD_END = b'</head>'
+
+_CHARSET = re.compile(r'charset=["\']?([\w-]+)', re.IGNORECASE)
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+_CHUNK_SIZE = 64 * 1024
+
+_HEALTH_WINDOW = 100
+_HEALTH_MIN_SAMPLES = 20
+_HEALTH_FAILURE_THRESHOLD = 3
+_HEALTH_COOLDOWN = 30.0
+
+
+class HostHealth:
+    """
+    Tracks the latency and consecutive failures of an upstream origin.
+
+    An origin is considered unhealthy for `_HEALTH_COOLDOWN` seconds after
+    `_HEALTH_FAILURE_THRESHOLD` consecutive failures.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=_HEALTH_WINDOW)
+        self._failures = 0
+        self._down_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def record(self, elapsed: float, ok: bool) -> None:
+        """
+        Records the outcome of a request to the origin.
+
+        Args:
+            elapsed (float): The request latency in seconds.
+            ok (bool): Whether the request succeeded.
+        """
+        with self._lock:
+            if ok:
+                self._latencies.append(elapsed)
+                self._failures = 0
+                return
+
+            self._failures += 1
+
+            if self._failures >= _HEALTH_FAILURE_THRESHOLD:
+                self._down_until = time.monotonic() + _HEALTH_COOLDOWN
+
+    def p95(self, default: float) -> float:
+        """
+        Returns the 95th percentile latency of the origin, or `default` if
+        there are not enough samples yet.
+        """
+        with self._lock:
+            if len(self._latencies) < _HEALTH_MIN_SAMPLES:
+                return default
+            samples = sorted(self._latencies)
+
+        return samples[int(len(samples) * 0.95) - 1]
+
+
+def _close_response(future: Future) -> None:
+    """
+    Closes the response of a hedged request that lost the race.
+    """
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class Page(t.NamedTuple):
+    """
+    An upstream page, as raw bytes and the encoding to decode them with.
+    """
+
+    url: str
+    content: bytes
+    encoding: str
+
 
 class RequestService:
+    _health: dict[str, HostHealth] = {}
+    _health_lock = threading.Lock()
+    _executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def health(cls, origin: str) -> HostHealth:
+        """
+        Returns the health tracker of the provided origin.
+        """
+        with cls._health_lock:
+            if origin not in cls._health:
+                cls._health[origin] = HostHealth()
+            return cls._health[origin]
+
     @classmethod
-    def get(cls, url: str):
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Returns the executor used for hedged requests, creating it on first
+        use so that no threads are started before the workers fork.
         """
-        Sends a GET request to the provided URL and returns the response
-        object.
-        If the response contains a 404 Not Found error, a NotFound exception is
-        raised.
+        with cls._health_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.HEDGE_WORKERS,
+                    thread_name_prefix='hedge',
+                )
+            return cls._executor
+
+    @classmethod
+    def candidates(cls, url: str) -> list[str]:
+        """
+        Returns the URL followed by its mirror URLs, as configured in
+        `settings.MIRRORS`. Healthy origins are tried first.
+
+        Args:
+            url (str): The upstream URL.
+
+        Returns:
+            list[str]: The URLs to try, in order.
+        """
+        parts = urlsplit(url)
+        origin = f'{parts.scheme}://{parts.netloc}'
+        mirrors = settings.MIRRORS.get(origin, ())
+
+        urls = [url]
+
+        for mirror in mirrors:
+            mirror_parts = urlsplit(mirror)
+            urls.append(
+                urlunsplit(
+                    parts._replace(
+                        scheme=mirror_parts.scheme,
+                        netloc=mirror_parts.netloc,
+                    )
+                )
+            )
+
+        return sorted(urls, key=lambda u: not cls._health_of(u).healthy)
+
+    @classmethod
+    def _health_of(cls, url: str) -> HostHealth:
+        parts = urlsplit(url)
+        return cls.health(f'{parts.scheme}://{parts.netloc}')
+
+    @classmethod
+    def _send(cls, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a GET request, recording its outcome in the origin health.
+        """
+        import requests
+
+        health = cls._health_of(url)
+        start = time.monotonic()
+
+        try:
+            resp = requests.get(url, **kwargs)
+        except requests.RequestException:
+            health.record(time.monotonic() - start, ok=False)
+            raise
+
+        health.record(time.monotonic() - start, ok=resp.status_code < 500)
+
+        return resp
+
+    @classmethod
+    def fetch(cls, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a GET request to the URL, hedging it against its mirrors.
+
+        If the primary origin has not answered within its p95 latency (or
+        `settings.HEDGE_DELAY` until enough samples exist), or fails, the
+        request is fired to the next mirror and the first successful
+        response wins. Without mirrors, this is a plain GET request.
 
         Args:
             url (str): The URL to send the GET request to.
+            **kwargs: Extra arguments passed to `requests.get`.
 
         Returns:
-            requests.Response: The response object from the GET request.
+            requests.Response: The first successful response, or the last
+                5xx response when every request fails.
+
+        Raises:
+            requests.RequestException: If every request fails without a
+                response.
+        """
+        urls = cls.candidates(url)
+
+        if len(urls) == 1:
+            return cls._send(url, **kwargs)
+
+        import requests
+
+        executor = cls._get_executor()
+        budget = cls._health_of(urls[0]).p95(settings.HEDGE_DELAY)
+        remaining = iter(urls)
+        pending = {executor.submit(cls._send, next(remaining), **kwargs)}
+        error_response: requests.Response | None = None
+        error: requests.RequestException | None = None
+
+        while pending:
+            done, pending = wait(
+                pending, timeout=budget, return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                try:
+                    resp = future.result()
+                except requests.RequestException as e:
+                    error = e
+                    continue
+
+                if resp.status_code >= 500:
+                    if error_response is not None:
+                        error_response.close()
+                    error_response = resp
+                    continue
+
+                for other in pending:
+                    other.add_done_callback(_close_response)
+
+                if error_response is not None:
+                    error_response.close()
+
+                return resp
+
+            next_url = next(remaining, None)
+
+            if next_url:
+                pending.add(executor.submit(cls._send, next_url, **kwargs))
+
+        if error_response is not None:
+            return error_response
+
+        raise error  # type: ignore
+
+    @classmethod
+    def _read_until(
+        cls, resp: requests.Response, until: tuple[bytes, bytes] | None
+    ) -> bytes:
+        """
+        Reads the response body, stopping early once the `until` end marker
+        is found after its start marker. The whole body is read when `until`
+        is not set or the markers are never found.
+        """
+        if until is None:
+            return resp.content
+
+        start, end = until
+        body = bytearray()
+        begin = -1
+        scanned = 0
+
+        for chunk in resp.iter_content(chunk_size=_CHUNK_SIZE):
+            body += chunk
+
+            if begin < 0:
+                begin = body.find(start, max(scanned - len(start), 0))
+
+            if begin >= 0 and (
+                body.find(end, max(begin + len(start), scanned - len(end)))
+                >= 0
+            ):
+                break
+
+            scanned = len(body)
+
+        return bytes(body)
+
+    @classmethod
+    def _encoding(cls, resp: requests.Response, head: bytes) -> str:
+        """
+        Returns the page encoding declared by the content-type header or the
+        `<meta>` charset, falling back to UTF-8 without sniffing the body.
+        """
+        match = _CHARSET.search(resp.headers.get('content-type', ''))
+
+        if match:
+            return match.group(1)
+
+        match = _META_CHARSET.search(head)
+
+        if match:
+            return match.group(1).decode('ascii')
+
+        return 'utf-8'
+
+    @classmethod
+    def get(cls, url: str, until: tuple[bytes, bytes] | None = None):
+        """
+        Sends a GET request to the provided URL and returns the page.
+        If the page head contains a 404 Not Found error, a NotFound exception
+        is raised.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            until (tuple[bytes, bytes], optional): Start and end markers of
+                the content needed from the page. Reading stops once the end
+                marker is found after the start marker.
+
+        Returns:
+            Page: The raw page and its encoding.
 
         Raises:
             NotFound: If the response contains a 404 Not Found error.
         """
-        resp = requests.get(url, allow_redirects=False)
+        with cls.fetch(url, allow_redirects=False, stream=True) as resp:
+            if resp.status_code == 302:
+                raise NotFound(f'{url} not found')
 
-        if re.search(_404_NOT_FOUND, resp.text) or resp.status_code == 302:
+            content = cls._read_until(resp, until)
+
+        head_end = content.find(_HEAD_END)
+        head = content if head_end < 0 else content[:head_end]
+
+        if _404_NOT_FOUND.search(head):
             raise NotFound(f'{url} not found')
 
-        return resp
+        return Page(url, content, cls._encoding(resp, head))
 
     @classmethod
     def stream(cls, url: str):
@@ -54,7 +366,7 @@ class RequestService:
         """
         headers = {'referer': 'https://manganato.com'}
 
-        with requests.get(url, stream=True, headers=headers) as resp:
+        with cls.fetch(url, stream=True, headers=headers) as resp:
             try:
                 ctype = resp.headers['content-type']
             except KeyError:
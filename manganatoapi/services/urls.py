@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import threading
+import typing as t
+from collections import OrderedDict
+
+from .. import settings, utils
+from ..exceptions import NotFound
+
+if t.TYPE_CHECKING:
+    import sqlite3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL
+);
+"""
+
+_ID_DIGEST_SIZE = 9
+
+
+class UrlService:
+    """
+    Maps upstream chapter and image URLs to compact, stable IDs.
+
+    An ID is a 12 characters hash of the URL, and the reverse mapping is kept
+    in the `settings.URL_DB` SQLite table, shared by every worker, with an
+    in-memory LRU in front of it. Without `settings.URL_DB`, URLs keep being
+    encoded as base64, which is always accepted when decoding.
+    """
+
+    _cache: OrderedDict[str, str] = OrderedDict()
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    @classmethod
+    def _connection(cls) -> sqlite3.Connection:
+        """
+        Returns the SQLite connection bound to the current thread.
+        """
+        import sqlite3
+
+        conn = getattr(cls._local, 'conn', None)
+
+        if conn is None:
+            conn = sqlite3.connect(settings.URL_DB, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+            cls._local.conn = conn
+
+        return conn
+
+    @classmethod
+    def _remember(cls, url_id: str, url: str) -> None:
+        with cls._lock:
+            cls._cache[url_id] = url
+            cls._cache.move_to_end(url_id)
+
+            while len(cls._cache) > settings.URL_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+
+    @staticmethod
+    def make_id(url: str) -> str:
+        """
+        Returns the compact ID of a URL.
+        """
+        digest = hashlib.blake2b(
+            url.encode('utf-8'), digest_size=_ID_DIGEST_SIZE
+        ).digest()
+        return base64.urlsafe_b64encode(digest).decode('ascii')
+
+    @classmethod
+    def encode_many(cls, urls: list[str]) -> list[str]:
+        """
+        Returns the IDs of the provided URLs, storing the new mappings.
+
+        Args:
+            urls (list[str]): The upstream URLs.
+
+        Returns:
+            list[str]: The IDs, in the same order.
+        """
+        if not settings.URL_DB:
+            return [utils.encode_url(url) for url in urls]
+
+        ids = [cls.make_id(url) for url in urls]
+        new = [
+            (url_id, url)
+            for url_id, url in zip(ids, urls, strict=True)
+            if url_id not in cls._cache
+        ]
+
+        if new:
+            with cls._connection() as conn:
+                conn.executemany(
+                    'INSERT OR IGNORE INTO urls (id, url) VALUES (?, ?)', new
+                )
+
+            for url_id, url in new:
+                cls._remember(url_id, url)
+
+        return ids
+
+    @classmethod
+    def decode(cls, url_id: str) -> str:
+        """
+        Returns the URL of an ID, or of a legacy base64-encoded URL.
+
+        Args:
+            url_id (str): The compact ID or base64-encoded URL.
+
+        Returns:
+            str: The upstream URL.
+
+        Raises:
+            NotFound: If the ID is unknown and is not valid base64.
+        """
+        url = cls._cache.get(url_id)
+
+        if url is not None:
+            return url
+
+        if settings.URL_DB:
+            row = (
+                cls._connection()
+                .execute('SELECT url FROM urls WHERE id = ?', (url_id,))
+                .fetchone()
+            )
+
+            if row:
+                cls._remember(url_id, row[0])
+                return row[0]
+
+        try:
+            url = utils.decode_url(url_id)
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise NotFound(f'{url_id} not found') from e
+
+        if not url.startswith(('https://', 'http://')):
+            raise NotFound(f'{url_id} not found')
+
+        return url
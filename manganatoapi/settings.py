@@ -6,6 +6,7 @@ VIEWS = {
     'manganatoapi.views.v1.manga',
     'manganatoapi.views.v1.chapter',
     'manganatoapi.views.v1.image',
+    'manganatoapi.views.v1.feed',
 }
 
 MIDDLEWARES = {
@@ -17,9 +18,120 @@ SERVICES = {
         'manganatoapi.services.request.RequestService',
         'manganatoapi.services.manga.MangaService',
         'manganatoapi.services.image.ImageService',
+        'manganatoapi.services.catalog.CatalogService',
+        'manganatoapi.services.parser.ParserService',
+        'manganatoapi.services.listing.ListingService',
+        'manganatoapi.services.feed.FeedService',
     }
 }
 
+# Mirror origins per upstream origin, e.g.
+# {'https://chapmanganato.to': ['https://chapmanganato.com']}. Requests to an
+# origin are hedged against its mirrors.
+MIRRORS: dict[str, list[str]] = {}
+
+HEDGE_DELAY = float(os.environ.get('HEDGE_DELAY', '1.0'))
+
+HEDGE_WORKERS = int(os.environ.get('HEDGE_WORKERS', '16'))
+
+PROFILE_DIR = os.environ.get('PROFILE_DIR', 'profiles')
+
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+
+PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN')
+
+PROFILE_INTERVAL = 0.005
+
+PROFILE_MAX_DURATION = 60.0
+
+# Parsers run in a process pool instead of the serving thread, e.g.
+# 'MangaService.info,MangaService.updates'.
+PARSE_OFFLOAD = {
+    name.strip()
+    for name in os.environ.get('PARSE_OFFLOAD', '').split(',')
+    if name.strip()
+}
+
+# Parsing processes per serving worker, so every gunicorn worker adds this
+# many processes: keep workers * PARSE_PROCESSES around the number of CPUs.
+# With 0, `PARSE_OFFLOAD` is ignored and every page is parsed inline.
+PARSE_PROCESSES = int(os.environ.get('PARSE_PROCESSES', '2'))
+
+LISTING_MAX_PAGES = 10
+
+LISTING_WORKERS = int(os.environ.get('LISTING_WORKERS', '8'))
+
+LISTING_CACHE_TTL = float(os.environ.get('LISTING_CACHE_TTL', '60'))
+
+LISTING_CACHE_SIZE = 256
+
+# Threads of each worker, as passed to gunicorn's --threads. Feed
+# subscribers hold a thread for up to `FEED_MAX_DURATION` seconds, so they
+# only get a share of them and the other routes keep answering.
+THREADS = int(os.environ.get('THREADS', '8'))
+
+FEED_INTERVAL = float(os.environ.get('FEED_INTERVAL', '60'))
+
+FEED_MAX_CONNECTIONS = int(
+    os.environ.get('FEED_MAX_CONNECTIONS', max(1, THREADS // 8))
+)
+
+FEED_MAX_DURATION = 300.0
+
+FEED_HEARTBEAT = 15.0
+
+FEED_BACKLOG = 100
+
+# SQLite database of the compact chapter and image IDs. Without it, URLs
+# are encoded as base64.
+URL_DB = os.environ.get('URL_DB')
+
+URL_CACHE_SIZE = 100_000
+
+# Concurrency limits per route class. Requests over `concurrency` wait for
+# up to `timeout` seconds in a queue of at most `queue` requests, cache hits
+# first, and otherwise get a 503 with Retry-After. Waiting requests hold a
+# thread too, so the running and queued requests of every class plus the
+# feed subscribers add up to `THREADS`: a burst on one class can't take the
+# threads of the others. Images fail fast instead of queueing. Set it to
+# `{}` to disable admission control.
+_ADMISSION_IMAGES = int(
+    os.environ.get('ADMISSION_IMAGES', max(1, THREADS // 4))
+)
+
+_ADMISSION_API_QUEUE = THREADS // 8
+
+ADMISSION = {
+    'images': {
+        'prefixes': ['/v1/images'],
+        'concurrency': _ADMISSION_IMAGES,
+        'queue': 0,
+        'timeout': 0.0,
+        'retry_after': 1,
+    },
+    'api': {
+        'prefixes': ['/v1/mangas', '/v1/chapters'],
+        'concurrency': int(
+            os.environ.get(
+                'ADMISSION_API',
+                THREADS
+                - FEED_MAX_CONNECTIONS
+                - _ADMISSION_IMAGES
+                - _ADMISSION_API_QUEUE,
+            )
+        ),
+        'queue': _ADMISSION_API_QUEUE,
+        'timeout': 2.0,
+        'retry_after': 2,
+    },
+}
+
+CATALOG_DB = os.environ.get('CATALOG_DB')
+
+CRAWLER_WORKERS = int(os.environ.get('CRAWLER_WORKERS', '4'))
+
+CRAWLER_DELAY = float(os.environ.get('CRAWLER_DELAY', '1.0'))
+
 try:
     from .local_settings import *  # type: ignore # noqa: F403
 except ImportError:
@@ -4,9 +4,10 @@ import re
 import typing as t
 from urllib.parse import urljoin, urlparse
 
-import parsel
 from restcraft.core import JSONResponse
 
+from .exceptions import InvalidFields, InvalidPageRange
+
 
 def make_url(base_url: str, manga_url: str | None):
     """
@@ -65,7 +66,11 @@ def success_response(message: str, payload: t.Any):
 
 
 def error_response(
-    message: str, status_code: int, exception_code: str, payload: t.Any = None
+    message: str,
+    status_code: int,
+    exception_code: str,
+    payload: t.Any = None,
+    headers: dict[str, str] | None = None,
 ):
     """
     Constructs a JSON response with the provided error message, status code,
@@ -77,6 +82,8 @@ def error_response(
         exception_code (str): The exception code to include in the response.
         payload (t.Any, optional): Any additional data to include in the
             response. Defaults to None.
+        headers (dict[str, str], optional): Extra response headers.
+            Defaults to None.
 
     Returns:
         JSONResponse: The constructed JSON response.
@@ -87,20 +94,174 @@ def error_response(
         **(payload or {}),
     }
 
-    return JSONResponse(response, status_code=status_code)
+    return JSONResponse(response, status_code=status_code, headers=headers)
 
 
-def get_selector(resp_text: str):
+def get_selector(body: bytes, encoding: str = 'utf-8'):
     """
-    Constructs a Parsel selector from the provided response text.
+    Constructs a Parsel selector from the provided raw response body, letting
+    lxml decode it instead of building an intermediate string.
 
     Args:
-        resp_text (str): The response text to create the selector from.
+        body (bytes): The response body to create the selector from.
+        encoding (str): The encoding of the response body.
 
     Returns:
         parsel.Selector: The constructed Parsel selector.
     """
-    return parsel.Selector(resp_text).xpath
+    import parsel
+
+    return parsel.Selector(body=body, encoding=encoding).xpath
+
+
+def parse_fields(value: str | None, allowed: t.Container[str]):
+    """
+    Parses a comma separated `fields` query parameter. Field names may be
+    given in camelCase, as they appear in the responses.
+
+    Args:
+        value (str | None): The query parameter value.
+        allowed (Container[str]): The snake_case field names of the endpoint.
+
+    Returns:
+        frozenset[str] | None: The snake_case field names, or `None` if no
+            field was requested.
+
+    Raises:
+        InvalidFields: If a field is not one of `allowed`.
+    """
+    if not value:
+        return None
+
+    fields = frozenset(
+        re.sub(r'(?<!^)(?=[A-Z])', '_', name.strip()).lower()
+        for name in value.split(',')
+        if name.strip()
+    )
+
+    unknown = sorted(name for name in fields if name not in allowed)
+
+    if unknown:
+        raise InvalidFields(f'Unknown fields: {", ".join(unknown)}')
+
+    return fields or None
+
+
+def parse_page_range(value: str, max_pages: int):
+    """
+    Parses a `pages` query parameter, either a single page (``3``) or an
+    inclusive range (``1-5``).
+
+    Args:
+        value (str): The query parameter value.
+        max_pages (int): The maximum number of pages in a range.
+
+    Returns:
+        tuple[int, int]: The first and last pages.
+
+    Raises:
+        InvalidPageRange: If the value is not a valid page range.
+    """
+    first, _, last = value.partition('-')
+
+    try:
+        first = int(first)
+        last = int(last) if last else first
+    except ValueError as e:
+        raise InvalidPageRange(f'Invalid page range: {value}') from e
+
+    if first < 1 or last < first or last - first >= max_pages:
+        raise InvalidPageRange(f'Invalid page range: {value}')
+
+    return first, last
+
+
+def pick_fields(
+    extractors: dict[str, t.Callable[[], t.Any]],
+    fields: t.Container[str] | None,
+):
+    """
+    Builds a dictionary by calling only the extractors of the requested
+    fields, so unrequested fields are never computed.
+
+    Args:
+        extractors (dict[str, Callable]): The field extractors by name.
+        fields (Container[str] | None): The requested field names, or `None`
+            for all fields.
+
+    Returns:
+        dict: The extracted fields.
+    """
+    return {
+        name: extract()
+        for name, extract in extractors.items()
+        if fields is None or name in fields
+    }
+
+
+def filter_fields(data: t.Any, fields: t.Container[str] | None):
+    """
+    Restricts an already extracted entry, or list of entries, to the
+    requested fields.
+
+    Args:
+        data (dict | list[dict]): The extracted data.
+        fields (Container[str] | None): The requested field names, or `None`
+            for all fields.
+
+    Returns:
+        dict | list[dict]: The restricted data.
+    """
+    if fields is None or data is None:
+        return data
+
+    if isinstance(data, list):
+        return [filter_fields(item, fields) for item in data]
+
+    return {k: v for k, v in data.items() if k in fields}
+
+
+def key_to_camel_case(key: str) -> str:
+    """
+    Converts a snake_case string to camelCase.
+
+    Args:
+        key (str): The snake_case string to convert.
+
+    Returns:
+        str: The converted camelCase string.
+    """
+    c = key.split('_')
+    return c[0].lower() + ''.join(x.title() for x in c[1:])
+
+
+def snake_to_camel(body: dict) -> dict[str, t.Any]:
+    """
+    Recursively traverses a dictionary, converting all keys from snake_case
+    to camelCase.
+
+    Args:
+        body (dict): The dictionary to be converted from snake_case to
+            camelCase.
+
+    Returns:
+        dict: The converted dictionary with camelCase keys.
+    """
+    new_body = {}
+
+    for k, v in body.items():
+        key = key_to_camel_case(k)
+        if isinstance(v, dict):
+            new_body[key] = snake_to_camel(v)
+        elif isinstance(v, list):
+            new_body[key] = [
+                snake_to_camel(item) if isinstance(item, dict) else item
+                for item in v
+            ]
+        else:
+            new_body[key] = v
+
+    return new_body
 
 
 def get_chapter_number(chapter_url: str | None):
@@ -6,7 +6,7 @@ import typing as t
 from restcraft.core import JSONResponse, Request, View
 from restcraft.core.di import inject
 
-from ... import utils
+from ... import exceptions, utils
 
 if t.TYPE_CHECKING:
     from ...services.manga import MangaService
@@ -33,7 +33,7 @@ class ChapterView(View):
         )
 
     def on_exception(self, req: Request, exc: Exception) -> JSONResponse:
-        if not isinstance(exc, binascii.Error):
+        if not isinstance(exc, (exceptions.NotFound, binascii.Error)):
             raise exc
 
         return utils.error_response(
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import typing as t
+
+from restcraft.core import JSONResponse, Request, View
+from restcraft.core.di import inject
+
+from ... import utils
+from ...responses import EventStreamResponse
+
+if t.TYPE_CHECKING:
+    from ...services.feed import FeedService
+
+
+class FeedView(View):
+    """
+    Defines the `FeedView` class, which is a view for handling requests to
+    the `/feed` route.
+
+    This view streams the new and updated mangas of the latest updates
+    listing as Server-Sent Events. Each subscriber holds a server thread, so
+    only `settings.FEED_MAX_CONNECTIONS` subscribers are served per worker.
+    """
+
+    route = '/v1/feed'
+    methods = ['GET']
+
+    @inject
+    def handler(
+        self, req: Request, service: FeedService
+    ) -> EventStreamResponse | JSONResponse:
+        stream = service.subscribe(req.header.get('last-event-id'))
+
+        if stream is None:
+            return utils.error_response(
+                status_code=503,
+                message='Too many feed subscribers, try again later.',
+                exception_code='FEED_UNAVAILABLE',
+                headers={'retry-after': '30'},
+            )
+
+        return EventStreamResponse(stream)
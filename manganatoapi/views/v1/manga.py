@@ -5,9 +5,12 @@ import typing as t
 from restcraft.core import JSONResponse, Request, View
 from restcraft.core.di import inject
 
-from ... import exceptions, utils
+from ... import exceptions, settings, utils
+from ...services.manga import INFO_FIELDS, LISTING_FIELDS
 
 if t.TYPE_CHECKING:
+    from ...services.catalog import CatalogService
+    from ...services.listing import ListingService
     from ...services.manga import MangaService
 
 
@@ -17,30 +20,61 @@ class MangaView(View):
     `/mangas` route.
 
     This view is responsible for fetching and returning the latest manga
-    updates.
+    updates. A range of pages can be requested at once with `pages`, e.g.
+    `pages=1-5`.
     """
 
     route = '/v1/mangas'
     methods = ['GET']
 
     @inject
-    def handler(self, req: Request, service: MangaService) -> JSONResponse:
-        page = 1
+    def handler(self, req: Request, service: ListingService) -> JSONResponse:
+        first = last = 1
         search = None
+        fields = None
 
         if req.query:
-            page = req.query.get('page', default=1, type=int)
+            first = last = req.query.get('page', default=1, type=int)
             search = req.query.get('q', type=str)
+            fields = utils.parse_fields(
+                req.query.get('fields', type=str), LISTING_FIELDS
+            )
 
-        if search:
-            updates = service.search(search, page)
-        else:
-            updates = service.updates(page)
+            if pages := req.query.get('pages', type=str):
+                first, last = utils.parse_page_range(
+                    pages, settings.LISTING_MAX_PAGES
+                )
+
+        updates = service.get(search, first, last, fields)
 
         return utils.success_response(
             'Latest manga updates fetched successful.', payload=updates
         )
 
+    def on_exception(self, req: Request, exc: Exception) -> JSONResponse:
+        if isinstance(exc, exceptions.NotFound):
+            return utils.error_response(
+                status_code=404,
+                message='Page not found.',
+                exception_code='PAGE_NOT_FOUND',
+            )
+
+        if isinstance(exc, exceptions.InvalidFields):
+            return utils.error_response(
+                status_code=400,
+                message=str(exc),
+                exception_code='INVALID_FIELDS',
+            )
+
+        if not isinstance(exc, exceptions.InvalidPageRange):
+            raise exc
+
+        return utils.error_response(
+            status_code=400,
+            message='Invalid page range.',
+            exception_code='INVALID_PAGE_RANGE',
+        )
+
 
 class MangaInfoView(View):
     """
@@ -59,16 +93,41 @@ class MangaInfoView(View):
         req.set_params = {'prefix': prefix, 'manga': manga}
 
     @inject
-    def handler(self, req: Request, service: MangaService) -> JSONResponse:
-        manga_info = service.info(
-            prefix=req.params['prefix'], manga=req.params['manga']
+    def handler(
+        self, req: Request, service: MangaService, catalog: CatalogService
+    ) -> JSONResponse:
+        fields = None
+
+        if req.query:
+            fields = utils.parse_fields(
+                req.query.get('fields', type=str), INFO_FIELDS
+            )
+
+        manga_info = catalog.info(
+            f'{req.params["prefix"]}-{req.params["manga"]}'
         )
 
+        if manga_info is not None:
+            manga_info = utils.filter_fields(manga_info, fields)
+        else:
+            manga_info = service.info(
+                prefix=req.params['prefix'],
+                manga=req.params['manga'],
+                fields=fields,
+            )
+
         return utils.success_response(
             'Latest manga info fetched successful.', payload=manga_info
         )
 
     def on_exception(self, req: Request, exc: Exception) -> JSONResponse:
+        if isinstance(exc, exceptions.InvalidFields):
+            return utils.error_response(
+                status_code=400,
+                message=str(exc),
+                exception_code='INVALID_FIELDS',
+            )
+
         if not isinstance(exc, exceptions.NotFound):
             raise exc
 
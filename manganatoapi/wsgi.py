@@ -1,3 +1,10 @@
 from restcraft.wsgi import get_wsgi_application
 
-application = get_wsgi_application()
+from . import settings
+from .middlewares.admission import AdmissionControl
+from .middlewares.profiling import RequestProfiler
+
+application = RequestProfiler(get_wsgi_application())
+
+if settings.ADMISSION:
+    application = AdmissionControl(application)
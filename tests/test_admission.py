@@ -0,0 +1,160 @@
+import threading
+import time
+
+import pytest
+
+import manganatoapi.wsgi  # noqa: F401
+from manganatoapi import settings
+from manganatoapi.middlewares.admission import (
+    AdmissionControl,
+    AdmissionLimiter,
+)
+
+
+def acquire_in_background(limiter, hit):
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.setdefault('admitted', limiter.acquire(hit))
+    )
+    thread.start()
+    time.sleep(0.05)
+    return thread, result
+
+
+def test_admits_up_to_the_concurrency():
+    limiter = AdmissionLimiter(concurrency=2, queue=0, timeout=1)
+
+    assert limiter.acquire(False)
+    assert limiter.acquire(True)
+    assert not limiter.acquire(False)
+
+    limiter.release()
+
+    assert limiter.acquire(False)
+
+
+def test_rejects_when_the_queue_is_full():
+    limiter = AdmissionLimiter(concurrency=1, queue=1, timeout=1)
+    assert limiter.acquire(False)
+    waiting, result = acquire_in_background(limiter, False)
+
+    start = time.monotonic()
+    assert not limiter.acquire(False)
+    assert time.monotonic() - start < 0.5
+
+    limiter.release()
+    waiting.join(1)
+    assert result['admitted']
+
+
+def test_wait_times_out():
+    limiter = AdmissionLimiter(concurrency=1, queue=1, timeout=0.1)
+    assert limiter.acquire(False)
+
+    start = time.monotonic()
+    assert not limiter.acquire(False)
+    assert time.monotonic() - start >= 0.1
+
+    limiter.release()
+    assert limiter.acquire(False)
+
+
+def test_waiting_hits_are_admitted_before_misses():
+    limiter = AdmissionLimiter(concurrency=1, queue=2, timeout=1)
+    assert limiter.acquire(False)
+    miss, miss_result = acquire_in_background(limiter, False)
+    hit, hit_result = acquire_in_background(limiter, True)
+
+    limiter.release()
+    hit.join(1)
+
+    assert hit_result == {'admitted': True}
+    assert miss_result == {}
+
+    limiter.release()
+    miss.join(1)
+
+    assert miss_result == {'admitted': True}
+
+
+def test_hit_takes_the_place_of_a_waiting_miss_when_full():
+    limiter = AdmissionLimiter(concurrency=1, queue=1, timeout=1)
+    assert limiter.acquire(False)
+    miss, miss_result = acquire_in_background(limiter, False)
+    hit, hit_result = acquire_in_background(limiter, True)
+
+    miss.join(1)
+    assert miss_result == {'admitted': False}
+
+    limiter.release()
+    hit.join(1)
+    assert hit_result == {'admitted': True}
+
+
+def test_hit_is_rejected_when_the_queue_is_full_of_hits():
+    limiter = AdmissionLimiter(concurrency=1, queue=1, timeout=1)
+    assert limiter.acquire(False)
+    waiting, _ = acquire_in_background(limiter, True)
+
+    assert not limiter.acquire(True)
+
+    limiter.release()
+    waiting.join(1)
+
+
+@pytest.fixture
+def admission(monkeypatch):
+    monkeypatch.setattr(settings, 'THREADS', 4)
+    monkeypatch.setattr(settings, 'FEED_MAX_CONNECTIONS', 1)
+    monkeypatch.setattr(
+        settings,
+        'ADMISSION',
+        {
+            'images': {
+                'prefixes': ['/v1/images'],
+                'concurrency': 1,
+                'queue': 0,
+                'timeout': 0.0,
+                'retry_after': 7,
+            },
+        },
+    )
+
+
+def request(app, path):
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response['status'] = status
+        response['headers'] = dict(headers)
+
+    body = app({'PATH_INFO': path, 'REQUEST_METHOD': 'GET'}, start_response)
+    return response, body
+
+
+def test_rejected_requests_get_a_503_with_retry_after(admission):
+    def app(env, start_response):
+        start_response('200 OK', [])
+        yield b'image'
+
+    control = AdmissionControl(app)
+    first, first_body = request(control, '/v1/images/a')
+    assert next(first_body) == b'image'
+
+    second, second_body = request(control, '/v1/images/b')
+    list(second_body)
+
+    assert second['status'].startswith('503')
+    assert second['headers']['retry-after'] == '7'
+
+    first_body.close()
+    third, third_body = request(control, '/v1/images/c')
+
+    assert list(third_body) == [b'image']
+    assert third['status'] == '200 OK'
+
+
+def test_classes_that_do_not_fit_are_not_limited(admission, monkeypatch):
+    monkeypatch.setattr(settings, 'THREADS', 1)
+
+    assert AdmissionControl(lambda env, start_response: []).classes == []
@@ -0,0 +1,68 @@
+import requests
+
+from manganatoapi.crawler import INFO_ATTEMPTS, Crawler
+from manganatoapi.exceptions import NotFound
+from manganatoapi.services.catalog import CatalogService
+
+
+class FakeManga:
+    def __init__(self, chapters, failing=()):
+        self.chapters = chapters
+        self.failing = set(failing)
+        self.info_calls = []
+
+    def updates(self, page):
+        if page > 1:
+            raise NotFound(page)
+
+        return [
+            {'url': f'/mangas/{manga_id}', 'last_chapter': chapter}
+            for manga_id, chapter in self.chapters.items()
+        ]
+
+    def info(self, manga, prefix):
+        manga_id = f'{prefix}-{manga}'
+        self.info_calls.append(manga_id)
+
+        if manga_id in self.failing:
+            raise requests.ConnectionError(manga_id)
+
+        return {'title': manga_id}
+
+
+def test_failed_info_does_not_abort_the_crawl_and_is_retried(tmp_path):
+    catalog = CatalogService(str(tmp_path / 'catalog.db'))
+    manga = FakeManga({'mu-a': '1', 'mu-b': '1'}, failing={'mu-a'})
+
+    assert Crawler(manga, catalog, delay=0).run() == 1
+
+    assert manga.info_calls.count('mu-a') == INFO_ATTEMPTS
+    assert catalog.info('mu-a') is None
+    assert catalog.info('mu-b') == {'title': 'mu-b'}
+
+    manga.failing.clear()
+    manga.info_calls.clear()
+    Crawler(manga, catalog, delay=0).run()
+
+    assert manga.info_calls == ['mu-a']
+    assert catalog.info('mu-a') == {'title': 'mu-a'}
+
+
+def test_failed_update_keeps_the_stored_chapter(tmp_path):
+    catalog = CatalogService(str(tmp_path / 'catalog.db'))
+    manga = FakeManga({'mu-a': '1'})
+    Crawler(manga, catalog, delay=0).run()
+
+    manga.chapters['mu-a'] = '2'
+    manga.failing.add('mu-a')
+    Crawler(manga, catalog, delay=0).run()
+
+    assert catalog.last_chapter('mu-a') == (True, '1')
+    assert catalog.updates(1)[0]['last_chapter'] == '2'
+
+    manga.failing.clear()
+    manga.info_calls.clear()
+    Crawler(manga, catalog, delay=0).run()
+
+    assert manga.info_calls == ['mu-a']
+    assert catalog.last_chapter('mu-a') == (True, '2')
@@ -0,0 +1,179 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from manganatoapi import settings
+from manganatoapi.services.request import RequestService
+
+PRIMARY = 'https://chapmanganato.to/manga-aa951409'
+MIRROR = 'https://chapmanganato.com/manga-aa951409'
+
+
+@pytest.fixture(autouse=True)
+def mirrors(monkeypatch):
+    monkeypatch.setattr(
+        settings,
+        'MIRRORS',
+        {'https://chapmanganato.to': ['https://chapmanganato.com']},
+    )
+    monkeypatch.setattr(settings, 'HEDGE_DELAY', 0.05)
+    monkeypatch.setattr(RequestService, '_health', {})
+
+
+def response(status_code=200):
+    resp = mock.Mock(spec=requests.Response)
+    resp.status_code = status_code
+    return resp
+
+
+def upstream(**by_url):
+    """
+    Patches `requests.get` to answer each URL with a `(delay, result)` pair,
+    where the result is either a response or an exception to raise.
+    """
+
+    def get(url, **kwargs):
+        delay, result = by_url[url]
+        time.sleep(delay)
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    return mock.patch('requests.get', side_effect=get)
+
+
+def test_without_mirrors_sends_a_plain_request(monkeypatch):
+    monkeypatch.setattr(settings, 'MIRRORS', {})
+    ok = response()
+
+    with upstream(**{PRIMARY: (0, ok)}) as get:
+        assert RequestService.fetch(PRIMARY) is ok
+
+    get.assert_called_once_with(PRIMARY)
+
+
+def test_fast_primary_is_not_hedged():
+    ok = response()
+
+    with upstream(**{PRIMARY: (0, ok), MIRROR: (0, response())}) as get:
+        assert RequestService.fetch(PRIMARY) is ok
+
+    assert [c.args[0] for c in get.call_args_list] == [PRIMARY]
+
+
+def test_slow_primary_is_hedged_and_closed():
+    slow, fast = response(), response()
+    closed = threading.Event()
+    slow.close.side_effect = closed.set
+
+    with upstream(**{PRIMARY: (0.3, slow), MIRROR: (0, fast)}):
+        assert RequestService.fetch(PRIMARY) is fast
+        assert closed.wait(2)
+
+    fast.close.assert_not_called()
+
+
+def test_failed_primary_is_retried_on_mirror():
+    ok = response()
+
+    with upstream(
+        **{PRIMARY: (0, requests.ConnectionError()), MIRROR: (0, ok)}
+    ):
+        assert RequestService.fetch(PRIMARY) is ok
+
+
+def test_server_error_is_closed_when_mirror_succeeds():
+    error, ok = response(503), response()
+
+    with upstream(**{PRIMARY: (0, error), MIRROR: (0, ok)}):
+        assert RequestService.fetch(PRIMARY) is ok
+
+    error.close.assert_called_once()
+
+
+def test_all_failing_raises_the_last_exception():
+    with upstream(
+        **{
+            PRIMARY: (0, requests.ConnectionError('primary')),
+            MIRROR: (0, requests.Timeout('mirror')),
+        }
+    ):
+        with pytest.raises(requests.Timeout):
+            RequestService.fetch(PRIMARY)
+
+
+@pytest.mark.parametrize('error_delay', [0, 0.2])
+def test_server_error_wins_over_exception_in_any_order(error_delay):
+    error = response(500)
+
+    with upstream(
+        **{
+            PRIMARY: (error_delay, error),
+            MIRROR: (0.1, requests.ConnectionError()),
+        }
+    ):
+        assert RequestService.fetch(PRIMARY) is error
+
+    error.close.assert_not_called()
+
+
+def test_only_the_returned_server_error_is_left_open():
+    first, last = response(500), response(502)
+
+    with upstream(**{PRIMARY: (0, first), MIRROR: (0.1, last)}):
+        assert RequestService.fetch(PRIMARY) is last
+
+    first.close.assert_called_once()
+    last.close.assert_not_called()
+
+
+def streamed(*chunks):
+    resp = response()
+    consumed = []
+
+    def iter_content(chunk_size):
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    resp.iter_content.side_effect = iter_content
+    return resp, consumed
+
+
+def test_read_until_stops_after_the_end_marker():
+    resp, consumed = streamed(b'<a>', b'<start>x', b'<end>', b'tail')
+
+    body = RequestService._read_until(resp, (b'<start>', b'<end>'))
+
+    assert body == b'<a><start>x<end>'
+    assert len(consumed) == 3
+
+
+def test_read_until_finds_markers_split_across_chunks():
+    resp, consumed = streamed(b'<a><sta', b'rt>x</', b'end>', b'tail')
+
+    body = RequestService._read_until(resp, (b'<start>', b'</end>'))
+
+    assert body == b'<a><start>x</end>'
+    assert len(consumed) == 3
+
+
+def test_read_until_ignores_an_end_marker_before_the_start():
+    resp, _ = streamed(b'<end>', b'<start>', b'x', b'<end>', b'tail')
+
+    body = RequestService._read_until(resp, (b'<start>', b'<end>'))
+
+    assert body == b'<end><start>x<end>'
+
+
+def test_read_until_reads_everything_without_markers():
+    resp, _ = streamed(b'<a>', b'<b>')
+
+    assert RequestService._read_until(resp, (b'<start>', b'<end>')) == (
+        b'<a><b>'
+    )
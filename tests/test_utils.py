@@ -0,0 +1,37 @@
+import pytest
+
+from manganatoapi import utils
+from manganatoapi.exceptions import InvalidFields, InvalidPageRange
+from manganatoapi.services.manga import INFO_FIELDS, LISTING_FIELDS
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [('3', (3, 3)), ('1-5', (1, 5)), ('2-2', (2, 2)), ('1-10', (1, 10))],
+)
+def test_parse_page_range(value, expected):
+    assert utils.parse_page_range(value, 10) == expected
+
+
+@pytest.mark.parametrize(
+    'value', ['', 'a', '1-b', '0', '0-2', '5-3', '1-11', '-1', '1-2-3']
+)
+def test_parse_page_range_rejects_invalid_ranges(value):
+    with pytest.raises(InvalidPageRange):
+        utils.parse_page_range(value, 10)
+
+
+def test_parse_fields_accepts_camel_and_snake_case():
+    assert utils.parse_fields(
+        'title, lastChapter,last_update', LISTING_FIELDS
+    ) == frozenset({'title', 'last_chapter', 'last_update'})
+
+
+@pytest.mark.parametrize('value', [None, '', ',', ' , '])
+def test_parse_fields_without_fields(value):
+    assert utils.parse_fields(value, INFO_FIELDS) is None
+
+
+def test_parse_fields_rejects_unknown_fields():
+    with pytest.raises(InvalidFields, match='chapters, titel'):
+        utils.parse_fields('titel,chapters,title', LISTING_FIELDS)